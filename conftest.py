@@ -0,0 +1,9 @@
+"""pytest setup: render tests draw through a headless arcade window.
+
+arcade reads ARCADE_HEADLESS when it is first imported, and test_main.py
+imports it during collection, so the flag has to be set here.
+"""
+
+import os
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
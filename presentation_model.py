@@ -3,12 +3,13 @@
 # Transforms game state into visual specifications.
 # This layer decides WHAT to display, not HOW to display it.
 
+import time
 from dataclasses import dataclass
 from typing import Optional, Tuple, List
 from timeline_system import BranchState, TerrainType, Position
 
 
-@dataclass
+@dataclass(slots=True)
 class InteractionHint:
     """Describes an interaction hint to display on a cell."""
     text: str
@@ -17,7 +18,7 @@ class InteractionHint:
     is_inset: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class BranchViewSpec:
     """Visual specification for a single branch panel."""
     state: BranchState
@@ -35,7 +36,7 @@ class BranchViewSpec:
     alpha: float = 1.0  # For fade effects during animation
 
 
-@dataclass
+@dataclass(slots=True)
 class FrameViewSpec:
     """Complete visual specification for one frame.
 
@@ -125,7 +126,6 @@ class ViewModelBuilder:
               fetch_mode_enabled: bool = False,
               hints: dict = None) -> FrameViewSpec:
         """Build frame specification with slide animation and merge preview support."""
-        import time
         B = ViewModelBuilder
 
         # Get hints
@@ -155,9 +155,7 @@ class ViewModelBuilder:
         if not controller.has_branched:
             active = controller.get_active_branch()
             player_terrain = active.terrain.get(active.player.pos)
-            branch_terrains = {TerrainType.BRANCH1, TerrainType.BRANCH2,
-                             TerrainType.BRANCH3, TerrainType.BRANCH4}
-            branch_hint_active = player_terrain in branch_terrains
+            branch_hint_active = player_terrain in B.BRANCH_TERRAINS
 
         # Goal active check
         preview = controller.get_merge_preview()
@@ -180,7 +178,7 @@ class ViewModelBuilder:
             # Single branch, centered at full scale
             main_x, main_y, main_scale = B.CENTER_X, B.CENTER_Y, B.FOCUS_SCALE
             sub_x, sub_y, sub_scale = B.WINDOW_WIDTH + 50, B.CENTER_Y, B.SIDE_SCALE
-        elif merge_preview_active or merge_preview_progress > 0:
+        elif is_merge_preview:
             # Merge preview mode: both branches move to center, non-focused becomes transparent
             main_x, main_y, main_scale, sub_x, sub_y, sub_scale, main_alpha, sub_alpha = B._calc_merge_preview_positions(
                 focus, merge_preview_progress, merge_preview_active
@@ -480,10 +478,10 @@ class ViewModelBuilder:
     def _extract_interaction_hint(controller) -> Optional[InteractionHint]:
         """Convert controller hint tuple to InteractionHint dataclass."""
         raw = controller.get_interaction_hint()
-        text, color, pos, is_inset = raw
-        if not text:
+        if not raw[0]:
             return None
-        return InteractionHint(text=text, color=color, target_pos=pos, is_inset=is_inset)
+        # Tuple order matches InteractionHint fields: (text, color, target_pos, is_inset)
+        return InteractionHint(*raw)
 
     @staticmethod
     def _is_on_branch_point(state: BranchState) -> bool:
@@ -6,7 +6,15 @@
 import math
 import time
 import arcade
-from typing import Optional, Tuple, TYPE_CHECKING
+import pyglet
+from dataclasses import dataclass
+from arcade.shape_list import (
+    ShapeElementList, create_ellipse_filled, create_line, create_rectangle_filled,
+    create_rectangle_outline, create_triangles_strip_filled_with_colors
+)
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Hashable, Optional, Tuple, TYPE_CHECKING
 from timeline_system import BranchState, TerrainType, EntityType
 from presentation_model import ViewModelBuilder
 
@@ -23,6 +31,30 @@ WINDOW_WIDTH = 1280
 WINDOW_HEIGHT = 720
 PADDING = 30
 
+# Below these sizes (px) detail is sub-pixel or illegible and is skipped
+MIN_DASHED_BOX_SIZE = 4      # smaller boxes get a solid border
+MIN_LABEL_FONT_SIZE = 4      # smaller box labels are not drawn
+MIN_GRID_LINE_CELL_SIZE = 8  # smaller cells keep only switch borders
+
+# Max cached terrain SpriteLists (main + sub + merge-preview panel, with slack)
+TERRAIN_CACHE_SIZE = 8
+# Max cached arcade.Text objects (labels whose text varies would otherwise accumulate)
+TEXT_CACHE_SIZE = 256
+# Max cached outlined labels (9 arcade.Text objects each)
+OUTLINE_TEXT_CACHE_SIZE = 32
+# Max cached box body shapes (size x fill x border style)
+BOX_SHAPE_CACHE_SIZE = 64
+# Max cached branch-marker shapes (terrain x cell size x color/alpha)
+MARKER_CACHE_SIZE = 32
+
+# Text cache slot ids for per-cell/per-panel labels. Text, font size and anchors
+# are already part of the cache key, so the slot only names the call site.
+TEXT_GOAL = 0
+TEXT_TITLE = 1
+TEXT_UID = 2
+TEXT_HELD = 3
+TEXT_GHOST = 4
+
 # === Colors (RGBA for arcade) ===
 WHITE = (255, 255, 255)
 BLACK = (0, 0, 0)
@@ -43,7 +75,6 @@ PLAYER_RING_BLUE_GRAY = (120, 145, 170)
 
 SWITCH_OFF_COLOR  = (200, 200, 200)
 SWITCH_ON_COLOR   = (255, 200,   0)   # amber when pressed
-SWITCH_OFF_BORDER = (160, 160, 160)
 SWITCH_ON_BORDER  = (160, 120,   0)   # dark amber border
 SWITCH_INNER      = ( 90,  90,  90)   # visible inner frame when off
 INTERACT_GRAY = (100, 100, 100)
@@ -64,6 +95,32 @@ BOX_COLORS = [
     (100, 220, 180),  # Teal
 ]
 
+# Terrain tile tint per texture key (applied to the shared white tile texture)
+TERRAIN_TILE_COLORS = {
+    'white': WHITE,
+    'black': WALL_COLOR,
+    'gray': GRAY,
+    'yellow': YELLOW,
+    'light_orange': LIGHT_ORANGE,
+    'no_carry_bg': LIGHT_RED,
+    'switch_on': SWITCH_ON_COLOR,
+    'switch_off': SWITCH_OFF_COLOR,
+    'hole_filled': HOLE_COLOR,
+    'hole_empty': HOLE_COLOR,
+    'branch_highlight': (150, 255, 150),
+}
+
+# Terrain whose tile depends only on its type; everything else is resolved per cell
+PLAIN_TERRAIN_TILES = {
+    TerrainType.FLOOR: 'white',
+    TerrainType.WALL: 'black',
+}
+# Concentric rings on a branch point = remaining uses
+BRANCH_USES = {
+    TerrainType.BRANCH1: 1, TerrainType.BRANCH2: 2,
+    TerrainType.BRANCH3: 3, TerrainType.BRANCH4: 4,
+}
+
 # Hint panel colors
 HINT_BG = (40, 40, 40)
 HINT_TEXT_GRAY = (200, 200, 200)
@@ -80,6 +137,179 @@ def desaturate_color(color: Tuple[int, int, int], amount: float = 0.5) -> Tuple[
     )
 
 
+# Desaturated BOX_COLORS variants, indexed the same way as BOX_COLORS
+PREVIEW_BOX_COLORS = [desaturate_color(c, 0.3) for c in BOX_COLORS]  # Transparent merge-preview branch
+SHADOW_BOX_COLORS = [desaturate_color(c, 0.5) for c in BOX_COLORS]   # Unfocused shadow boxes
+GHOST_BOX_COLORS = [desaturate_color(c, 0.7) for c in BOX_COLORS]    # Fetch-hint ghosts
+
+
+@dataclass(slots=True, frozen=True)
+class CellMetrics:
+    """Pixel sizes derived from a cell size, shared by every draw at that size."""
+    scale: float
+    font_size: int        # UID / goal labels
+    box_padding: int      # grounded box inset
+    hole_padding: int     # in-hole box inset
+    border: int           # box border
+    inset: int            # goal/switch outline inset
+    outline: int          # switch and held-box outline width
+    goal_outline: int     # active goal outline width
+    player_pad: int       # held-box player inset
+    player_radius: int
+    ring_width: int       # inactive player ring
+    arrow_size: int
+    arrow_offset: int
+    lock_size: int        # pickup hint lock corners
+    lock_thickness: int
+    lock_margin: int      # negative: corners sit inside the grid lines
+    fetch_lock_size: int  # fetch hint lock corners
+    fetch_lock_thickness: int
+    fetch_dash: int       # fetch line dash length
+    converge_dash: int    # converge line dash length
+    ghost_padding: int    # fetch hint ghost box inset
+
+    @classmethod
+    def for_cell_size(cls, cell_size: int) -> 'CellMetrics':
+        scale = cell_size / CELL_SIZE
+        return cls(
+            scale=scale,
+            font_size=int(14 * scale),
+            box_padding=int(9 * scale),
+            hole_padding=int(15 * scale),
+            border=max(1, int(2 * scale)),
+            inset=max(1, int(3 * scale)),
+            outline=max(1, int(3 * scale)),
+            goal_outline=max(1, int(4 * scale)),
+            player_pad=int(5 * scale),
+            player_radius=cell_size // 5,
+            ring_width=max(2, int(3 * scale)),
+            arrow_size=int(21 * scale),
+            arrow_offset=int(8 * scale),
+            lock_size=int(20 * scale),
+            lock_thickness=max(2, int(6 * scale)),
+            lock_margin=-int(3 * scale),
+            fetch_lock_size=int(24 * scale),
+            fetch_lock_thickness=max(1, int(8 * scale)),
+            fetch_dash=int(12 * scale),
+            converge_dash=int(10 * scale),
+            ghost_padding=int(6 * scale),
+        )
+
+
+# === Geometry generators ===
+# Pure functions producing point lists for batched arcade.draw_lines calls.
+
+def dashed_line_points(x1: int, y1: int, x2: int, y2: int,
+                       dash_length: int = 9, offset: float = 0) -> list:
+    """Dash endpoint pairs from (x1, y1) to (x2, y2); offset scrolls the pattern."""
+    rel = dash_offsets(x2 - x1, y2 - y1, dash_length, offset % (dash_length * 2))
+    return [(int(x1 + ox), int(y1 + oy)) for ox, oy in rel]
+
+
+@lru_cache(maxsize=256)
+def dash_offsets(vx: int, vy: int, dash_length: int, phase: float) -> tuple:
+    """Unrounded dash endpoints relative to the line start, for vector (vx, vy) and phase.
+
+    Lines join grid-cell centers and phase steps with animation_frame, so the
+    set of distinct (vector, phase) keys stays small and is reused across frames.
+    Offsets stay as floats so dashed_line_points can truncate x1 + offset exactly
+    as the per-dash loop did.
+    """
+    dist = math.sqrt(vx**2 + vy**2)
+    if dist == 0:
+        return ()
+
+    dx = vx / dist
+    dy = vy / dist
+
+    period = dash_length * 2
+    pos = phase
+
+    points = []
+    while pos < dist:
+        seg_start = max(0.0, pos)
+        seg_end = min(dist, pos + dash_length)
+        if seg_end > seg_start:
+            points.append((dx * seg_start, dy * seg_start))
+            points.append((dx * seg_end, dy * seg_end))
+        pos += period
+    return tuple(points)
+
+
+@lru_cache(maxsize=64)
+def dashed_rect_points(w: int, h: int, dash_len: int = 5, gap_len: int = 5) -> tuple:
+    """Dash endpoint pairs for a w x h rect outline, relative to its top-left corner (y up)."""
+    points = []
+    period = dash_len + gap_len
+    for i in range(0, w, period):
+        end_i = min(i + dash_len, w)
+        points += [(i, 0), (end_i, 0)]           # Top edge
+        points += [(i, -h), (end_i, -h)]         # Bottom edge
+    for i in range(0, h, period):
+        end_i = min(i + dash_len, h)
+        points += [(0, -i), (0, -end_i)]         # Left edge
+        points += [(w, -i), (w, -end_i)]         # Right edge
+    return tuple(points)
+
+
+@lru_cache(maxsize=64)
+def arrow_offsets(dx: int, dy: int, size: int) -> tuple:
+    """Arrow triangle vertices relative to its anchor point (y up)."""
+    half = size // 2
+    if dy == 1:  # Up (screen)
+        return ((0, size), (-half, half), (half, half))
+    elif dy == -1:  # Down (screen)
+        return ((0, -size), (-half, -half), (half, -half))
+    elif dx == -1:  # Left
+        return ((-size, 0), (-half, -half), (-half, half))
+    else:  # Right
+        return ((size, 0), (half, -half), (half, half))
+
+
+@lru_cache(maxsize=32)
+def lock_corner_points(w: int, h: int, size: int) -> tuple:
+    """L-bracket segment endpoints for a w x h rect, relative to its top-left corner (y up)."""
+    return (
+        # Top-left
+        (0, -size), (0, 0),
+        (0, 0), (size, 0),
+        # Top-right
+        (w - size, 0), (w, 0),
+        (w, 0), (w, -size),
+        # Bottom-left
+        (0, -h + size), (0, -h),
+        (0, -h), (size, -h),
+        # Bottom-right
+        (w - size, -h), (w, -h),
+        (w, -h), (w, -h + size),
+    )
+
+
+@lru_cache(maxsize=16)
+def ring_strip_points(radius: int, width: int) -> tuple:
+    """Triangle-strip vertices of a ring around the origin, alternating outer/inner.
+
+    Matches arcade.draw_circle_outline: the band spans radius - width to radius,
+    with the same automatic segment count.
+    """
+    diameter = radius * 2
+    segments = max(3, 6 if diameter <= 12 else diameter // 2)
+    inner = radius - width
+    points = []
+    for i in range(segments + 1):
+        angle = math.tau * i / segments
+        sx, cy = math.sin(angle), math.cos(angle)
+        points += [(sx * radius, cy * radius), (sx * inner, cy * inner)]
+    return tuple(points)
+
+
+@lru_cache(maxsize=8)
+def outline_offsets(width: int) -> tuple:
+    """The 8 neighbour offsets used to fake a text outline of the given width."""
+    steps = (-width, 0, width)
+    return tuple((dx, dy) for dx in steps for dy in steps if dx or dy)
+
+
 class ArcadeRenderer:
     """Arcade-based renderer for the game."""
 
@@ -90,6 +320,8 @@ class ArcadeRenderer:
         self.peek_floor_mode = False
         # Grid size is set once at level load; does not change during gameplay.
         self.grid_size = DEFAULT_GRID_SIZE
+        # Goal flash phase (0/1), sampled once per frame in draw_frame
+        self._flash_phase = 0
 
         # === Texture Cache for SpriteList Rendering ===
         self._init_texture_cache()
@@ -97,45 +329,49 @@ class ArcadeRenderer:
     def set_grid_size(self, grid_size: int):
         """Set fixed grid size for current level (called once on level load)."""
         self.grid_size = max(1, int(grid_size))
+        self._cell_offsets.clear()
 
     def _init_texture_cache(self):
         """Initialize cached textures for GPU-batched rendering."""
-        # Terrain textures at base cell size
-        self._terrain_textures = {
-            'white': arcade.make_soft_square_texture(CELL_SIZE, WHITE, outer_alpha=255),
-            'black': arcade.make_soft_square_texture(CELL_SIZE, WALL_COLOR, outer_alpha=255),
-            'gray': arcade.make_soft_square_texture(CELL_SIZE, GRAY, outer_alpha=255),
-            'yellow': arcade.make_soft_square_texture(CELL_SIZE, YELLOW, outer_alpha=255),
-            'light_orange': arcade.make_soft_square_texture(CELL_SIZE, LIGHT_ORANGE, outer_alpha=255),
-            'no_carry_bg': arcade.make_soft_square_texture(CELL_SIZE, LIGHT_RED, outer_alpha=255),
-            'switch_on': arcade.make_soft_square_texture(CELL_SIZE, SWITCH_ON_COLOR, outer_alpha=255),
-            'switch_off': arcade.make_soft_square_texture(CELL_SIZE, SWITCH_OFF_COLOR, outer_alpha=255),
-            'hole_filled': arcade.make_soft_square_texture(CELL_SIZE, HOLE_COLOR, outer_alpha=255),  # Same as floor
-            'hole_empty': arcade.make_soft_square_texture(CELL_SIZE, HOLE_COLOR, outer_alpha=255),
-            'branch_highlight': arcade.make_soft_square_texture(CELL_SIZE, (150, 255, 150), outer_alpha=255),
-        }
+        # Terrain tiles share one white texture; each sprite is tinted via sprite.color
+        self._unit_white = arcade.make_soft_square_texture(CELL_SIZE, WHITE, outer_alpha=255)
 
-        # Box textures (one per color)
-        box_size = int(CELL_SIZE * 0.8)  # Box is smaller than cell
-        self._box_textures = [
-            arcade.make_soft_square_texture(box_size, color, outer_alpha=255)
-            for color in BOX_COLORS
-        ]
-        self._box_textures_desaturated = [
-            arcade.make_soft_square_texture(box_size, desaturate_color(color, 0.5), outer_alpha=255)
-            for color in BOX_COLORS
-        ]
+        # Per-cell_size (origins, centers) pixel offsets along one grid axis
+        self._cell_offsets: dict = {}
+        # Per-cell_size CellMetrics (see _get_metrics)
+        self._metrics_cache: dict = {}
+
+        # Terrain signatures computed this frame: id(state) -> (state, signature).
+        # States are mutated in place between frames, so this is reset per frame.
+        self._signature_memo: dict = {}
+        # Entity lookups built this frame: id(state) -> (state, (by_pos, by_uid)); same reset rule
+        self._index_memo: dict = {}
 
-        # Player textures
-        player_radius = CELL_SIZE // 5
-        self._player_texture = arcade.make_circle_texture(player_radius * 2, BLUE)
-        self._player_texture_gray = arcade.make_circle_texture(player_radius * 2, GRAY)
+        # Per-layout cell records (see _terrain_cells), LRU-bounded
+        self._cells_cache: OrderedDict = OrderedDict()
 
-        # Scaled texture cache (lazy-loaded)
-        self._scaled_textures: dict = {}
+        # Built terrain SpriteLists, LRU-bounded (see _build_terrain_spritelist)
+        self._terrain_cache: OrderedDict = OrderedDict()
 
-        # Text object cache for GPU-efficient text rendering
-        self._text_cache: dict = {}
+        # Grid-line geometry per terrain layout, LRU-bounded (see _draw_grid_lines)
+        self._grid_cache: OrderedDict = OrderedDict()
+        self._switch_cache: OrderedDict = OrderedDict()
+
+        # Tutorial backdrop geometry; one entry, keyed by layout (see _draw_tutorial)
+        self._tutorial_panel_cache: dict = {}
+
+        # Box fill + border geometry built around (0, 0), LRU-bounded
+        self._box_shape_cache: OrderedDict = OrderedDict()
+
+        # Branch-marker ring geometry built around (0, 0), LRU-bounded
+        self._marker_cache: OrderedDict = OrderedDict()
+
+        # Text object cache for GPU-efficient text rendering, LRU-bounded.
+        # key -> [arcade.Text, last applied color]
+        self._text_cache: OrderedDict = OrderedDict()
+        # Outlined labels: key -> (pyglet Batch, ((dx, dy, Text), ...), last [x, y],
+        # last [text color, outline color])
+        self._outline_text_cache: OrderedDict = OrderedDict()
 
         # Pre-create static text objects
         self._init_static_text()
@@ -154,14 +390,6 @@ class ArcadeRenderer:
                                        WHITE, font_size=16, anchor_x="center", anchor_y="center"),
         }
 
-        # Merge progress labels
-        self._merge_labels = {
-            'merging': arcade.Text("... Merge", 0, 0, (150, 50, 150), font_size=14,
-                                   anchor_x="left", anchor_y="center"),
-            'ready': arcade.Text("合併", 0, 0, (150, 50, 150), font_size=14,
-                                anchor_x="left", anchor_y="center"),
-        }
-
         # Fixed help hint (bottom-left corner)
         self._help_hint = arcade.Text(
             "[ESC] 返回選單   [F1] 關卡說明    [R] 重置   [Z] 回復   [C] 透視",
@@ -172,244 +400,266 @@ class ArcadeRenderer:
             anchor_y="bottom"
         )
 
-    def _get_text(self, key: str, text: str, x: int, y: int, color: tuple,
+    def _get_text(self, key: Hashable, text: str, x: int, y: int, color: tuple,
                   font_size: int = 14, anchor_x: str = "center", anchor_y: str = "center") -> arcade.Text:
-        """Get or create a cached text object."""
-        cache_key = (key, text, font_size, color, anchor_x, anchor_y)
-        if cache_key not in self._text_cache:
-            self._text_cache[cache_key] = arcade.Text(
+        """Get or create a cached text object.
+
+        Color is not part of the key: fading or tinting a label recolors the
+        cached object instead of laying out and uploading a new one.
+        """
+        cache_key = (key, text, font_size, anchor_x, anchor_y)
+        entry = self._text_cache.get(cache_key)
+        if entry is None:
+            text_obj = arcade.Text(
                 text, x, y, color, font_size=font_size,
                 anchor_x=anchor_x, anchor_y=anchor_y
             )
-        text_obj = self._text_cache[cache_key]
+            self._text_cache[cache_key] = [text_obj, color]
+            if len(self._text_cache) > TEXT_CACHE_SIZE:
+                self._text_cache.popitem(last=False)
+            return text_obj
+
+        self._text_cache.move_to_end(cache_key)
+        text_obj = entry[0]
+        if entry[1] != color:
+            text_obj.color = color
+            entry[1] = color
         # Update position (text content is cached, position may vary)
         text_obj.x = x
         text_obj.y = y
         return text_obj
 
-    def _draw_cached_text(self, key: str, text: str, x: int, y: int, color: tuple,
+    def _draw_cached_text(self, key: Hashable, text: str, x: int, y: int, color: tuple,
                           font_size: int = 14, anchor_x: str = "center", anchor_y: str = "center"):
         """Draw text using cache for better performance."""
         text_obj = self._get_text(key, text, x, y, color, font_size, anchor_x, anchor_y)
         text_obj.draw()
 
-    def _get_scaled_texture(self, base_key: str, scale: float) -> arcade.Texture:
-        """Get or create a scaled version of a base texture."""
-        cache_key = (base_key, scale)
-        if cache_key not in self._scaled_textures:
-            base_texture = self._terrain_textures[base_key]
-            if scale == 1.0:
-                self._scaled_textures[cache_key] = base_texture
-            else:
-                # Create scaled texture
-                new_size = int(CELL_SIZE * scale)
-                color_map = {
-                    'white': WHITE, 'black': WALL_COLOR, 'gray': GRAY,
-                    'yellow': YELLOW, 'light_orange': LIGHT_ORANGE,
-                    'no_carry_bg': LIGHT_RED,
-                    'switch_on': SWITCH_ON_COLOR, 'switch_off': SWITCH_OFF_COLOR,
-                    'hole_filled': HOLE_COLOR, 'hole_empty': HOLE_COLOR,
-                    'branch_highlight': (150, 255, 150),
-                }
-                self._scaled_textures[cache_key] = arcade.make_soft_square_texture(
-                    new_size, color_map[base_key], outer_alpha=255
-                )
-        return self._scaled_textures[cache_key]
+    def _get_cell_offsets(self, cell_size: int) -> tuple:
+        """Get (origins, centers) offsets of each grid index, relative to the panel origin."""
+        offsets = self._cell_offsets.get(cell_size)
+        if offsets is None:
+            half = cell_size // 2
+            origins = tuple(i * cell_size for i in range(self.grid_size))
+            offsets = (origins, tuple(o + half for o in origins))
+            self._cell_offsets[cell_size] = offsets
+        return offsets
+
+    def _get_metrics(self, cell_size: int) -> CellMetrics:
+        """Get scale-derived pixel sizes for a cell size, computed once per size."""
+        metrics = self._metrics_cache.get(cell_size)
+        if metrics is None:
+            metrics = CellMetrics.for_cell_size(cell_size)
+            self._metrics_cache[cell_size] = metrics
+        return metrics
+
+    def _terrain_signature(self, state: BranchState) -> tuple:
+        """Hashable snapshot of everything terrain rendering reads from a state.
+
+        Memoized for the current frame; the same state is signed several times
+        per frame (terrain SpriteList, cell records, grid and switch batches).
+        """
+        memo = self._signature_memo.get(id(state))
+        if memo is not None and memo[0] is state:
+            return memo[1]
+        # Only positions the terrain actually renders differently: boxes on
+        # plain floor must not invalidate the cached terrain
+        terrain = state.terrain
+        pressed = frozenset(e.pos for e in state.entities
+                            if e.type == EntityType.BOX and e.z == 0
+                            and terrain.get(e.pos) == TerrainType.SWITCH)
+        filled = frozenset(e.pos for e in state.entities
+                           if e.z == -1 and terrain.get(e.pos) == TerrainType.HOLE)
+        signature = (tuple(state.terrain.items()), pressed, filled)
+        self._signature_memo[id(state)] = (state, signature)
+        return signature
+
+    def _entity_index(self, state: BranchState) -> tuple:
+        """Per-frame (by_pos, by_uid, held) entity lookups for a state, built in one pass.
+
+        held lists the uids carried by the player, as state.get_held_items() does.
+        """
+        memo = self._index_memo.get(id(state))
+        if memo is not None and memo[0] is state:
+            return memo[1]
+        by_pos: dict = {}
+        by_uid: dict = {}
+        held = []
+        for e in state.entities:
+            by_pos.setdefault(e.pos, []).append(e)
+            by_uid.setdefault(e.uid, []).append(e)
+            if e.holder == 0:
+                held.append(e.uid)
+        index = (by_pos, by_uid, held)
+        self._index_memo[id(state)] = (state, index)
+        return index
+
+    def _terrain_cells(self, state: BranchState) -> tuple:
+        """Flat (gx, gy, pos, terrain, active) records for every cell, in grid order.
+
+        active is switch activation for SWITCH and fill state for HOLE. Records are
+        shared by the terrain SpriteList and grid-line builders and reused for as
+        long as the terrain signature is unchanged.
+        """
+        signature = self._terrain_signature(state)
+        key = (signature, self.grid_size)
+        cells = self._cells_cache.get(key)
+        if cells is not None:
+            self._cells_cache.move_to_end(key)
+            return cells
+
+        # Pressed-switch and filled-hole positions from the signature: O(1)
+        # membership tests instead of scanning state.entities per cell.
+        terrain_map, pressed, filled = state.terrain, signature[1], signature[2]
+        records = []
+        for gx in range(self.grid_size):
+            for gy in range(self.grid_size):
+                pos = (gx, gy)
+                terrain = terrain_map.get(pos, TerrainType.FLOOR)
+                if terrain == TerrainType.SWITCH:
+                    active = pos in pressed
+                elif terrain == TerrainType.HOLE:
+                    active = pos in filled
+                else:
+                    active = False
+                records.append((gx, gy, pos, terrain, active))
+        cells = tuple(records)
+        self._cells_cache[key] = cells
+        if len(self._cells_cache) > TERRAIN_CACHE_SIZE:
+            self._cells_cache.popitem(last=False)
+        return cells
 
     def _build_terrain_spritelist(self, state: BranchState, start_x: int, start_y: int,
                                    cell_size: int, goal_active: bool, has_branched: bool,
-                                   highlight_branch_point: bool,
-                                   terrain_diff_reference: Optional[BranchState] = None,
-                                   terrain_type_filter: Optional[str] = None) -> tuple:
+                                   highlight_branch_point: bool) -> tuple:
+        """Get terrain SpriteList for a branch, reusing it while the terrain is unchanged.
+
+        Returns (spritelist, dynamic_cells). Both are shared with later frames,
+        so callers must set spritelist.alpha before drawing and not mutate them.
+        """
+        key = (
+            self._terrain_signature(state),
+            start_x, start_y, cell_size, self.grid_size, goal_active,
+            state.player.pos if highlight_branch_point else None,
+        )
+        cached = self._terrain_cache.get(key)
+        if cached is not None:
+            self._terrain_cache.move_to_end(key)
+            return cached
+
+        result = self._create_terrain_spritelist(
+            state, start_x, start_y, cell_size, goal_active, has_branched,
+            highlight_branch_point
+        )
+        self._terrain_cache[key] = result
+        if len(self._terrain_cache) > TERRAIN_CACHE_SIZE:
+            self._terrain_cache.popitem(last=False)
+        return result
+
+    def _create_terrain_spritelist(self, state: BranchState, start_x: int, start_y: int,
+                                   cell_size: int, goal_active: bool, has_branched: bool,
+                                   highlight_branch_point: bool) -> tuple:
         """Build SpriteList for static terrain. Returns (spritelist, dynamic_cells).
 
         dynamic_cells contains positions that need immediate-mode rendering (Goal, highlighted branch).
-
-        Args:
-            terrain_diff_reference: If provided, only include cells where terrain differs from reference.
-            terrain_type_filter: "static" (FLOOR, WALL, etc.) or "variable" (SWITCH, HOLE) or None (all).
         """
         scale = cell_size / CELL_SIZE
-        sprites = arcade.SpriteList()
+        sprites = arcade.SpriteList(capacity=self.grid_size * self.grid_size)
         dynamic_cells = []  # (gx, gy, terrain_type) for immediate mode
-
-        for gx in range(self.grid_size):
-            for gy in range(self.grid_size):
-                pos = (gx, gy)
-                terrain = state.terrain.get(pos, TerrainType.FLOOR)
-                center_x = start_x + gx * cell_size + cell_size // 2
-                center_y = self._flip_y(start_y + gy * cell_size + cell_size // 2)
-
-                # Filter by terrain type (static/variable) if requested
-                if terrain_type_filter is not None:
-                    # Static terrain: everything except SWITCH and HOLE
-                    is_variable = terrain in (TerrainType.SWITCH, TerrainType.HOLE)
-
-                    if terrain_type_filter == "static" and is_variable:
-                        continue  # Skip variable terrain in static layer
-                    elif terrain_type_filter == "variable" and not is_variable:
-                        continue  # Skip static terrain in variable layer
-
-                # Filter: only draw cells that differ from reference (if provided)
-                if terrain_diff_reference is not None:
-                    ref_terrain = terrain_diff_reference.terrain.get(pos, TerrainType.FLOOR)
-
-                    # Check if terrain differs
-                    if terrain != ref_terrain:
-                        pass  # Different terrain type - include this cell
-                    elif terrain == TerrainType.SWITCH:
-                        # Check if switch activation state differs
-                        activated = state.switch_activated(pos)
-                        ref_activated = terrain_diff_reference.switch_activated(pos)
-                        if activated == ref_activated:
-                            continue  # Same activation state - skip
-                    elif terrain == TerrainType.HOLE:
-                        # Check if hole filled state differs
-                        filled = state.is_hole_filled(pos)
-                        ref_filled = terrain_diff_reference.is_hole_filled(pos)
-                        if filled == ref_filled:
-                            continue  # Same filled state - skip
-                    else:
-                        continue  # Same terrain, no state difference - skip
-
-                # Determine texture key
-                texture_key = None
-
-                if terrain == TerrainType.WALL:
-                    texture_key = 'black'
-                elif terrain == TerrainType.SWITCH:
-                    activated = state.switch_activated(pos)
-                    if terrain_diff_reference is not None:
-                        ref_activated = terrain_diff_reference.switch_activated(pos)
-                        if activated != ref_activated:
-                            # Draw diff as outline only to avoid overriding focused fill
-                            dynamic_cells.append((gx, gy, terrain, activated))
-                            texture_key = None
-                        else:
-                            texture_key = None
-                    else:
-                        texture_key = 'switch_on' if activated else 'switch_off'
-                        # Inactive switch center mark must stay below entities/player.
-                        if not activated:
-                            dynamic_cells.append((gx, gy, terrain, activated))
-                elif terrain == TerrainType.NO_CARRY:
-                    texture_key = 'no_carry_bg'
-                    dynamic_cells.append((gx, gy, terrain, False))  # Need NO_CARRY rendering
-                elif terrain in (TerrainType.BRANCH1, TerrainType.BRANCH2,
-                                TerrainType.BRANCH3, TerrainType.BRANCH4):
-                    # Check if this is a highlighted branch point
-                    if (highlight_branch_point and pos == state.player.pos):
-                        texture_key = 'branch_highlight'
-                        dynamic_cells.append((gx, gy, terrain, True))  # True = highlighted
-                    else:
-                        texture_key = 'white'
-                        dynamic_cells.append((gx, gy, terrain, False))  # Need branch marker
-                elif terrain == TerrainType.GOAL:
-                    # Goal is always dynamic (flash effect)
-                    dynamic_cells.append((gx, gy, terrain, goal_active))
-                    texture_key = None  # Will be drawn in immediate mode
-                elif terrain == TerrainType.HOLE:
-                    filled = state.is_hole_filled(pos)
-                    texture_key = 'hole_filled' if filled else 'hole_empty'
+        _, centers = self._get_cell_offsets(cell_size)
+        branch_terrains = ViewModelBuilder.BRANCH_TERRAINS
+        switch_mark_scale = max(4, int(cell_size * 0.28)) / CELL_SIZE
+
+        for gx, gy, pos, terrain, active in self._terrain_cells(state):
+            center_x = start_x + centers[gx]
+            center_y = WINDOW_HEIGHT - (start_y + centers[gy])
+
+            # Determine texture key: plain tiles by table, stateful ones below
+            texture_key = PLAIN_TERRAIN_TILES.get(terrain)
+            switch_mark = False
+
+            if texture_key is not None:
+                pass
+            elif terrain in branch_terrains:
+                # Check if this is a highlighted branch point
+                if (highlight_branch_point and pos == state.player.pos):
+                    texture_key = 'branch_highlight'
+                    dynamic_cells.append((gx, gy, terrain, True))  # True = highlighted
                 else:
                     texture_key = 'white'
-
-                # Create sprite if static
-                if texture_key:
-                    texture = self._get_scaled_texture(texture_key, scale)
-                    sprite = arcade.Sprite(texture)
-                    sprite.center_x = center_x
-                    sprite.center_y = center_y
-                    sprites.append(sprite)
+                    dynamic_cells.append((gx, gy, terrain, False))  # Need branch marker
+            elif terrain == TerrainType.SWITCH:
+                texture_key = 'switch_on' if active else 'switch_off'
+                # Inactive switch center mark is a tile too, so it stays below entities/player.
+                switch_mark = not active
+            elif terrain == TerrainType.HOLE:
+                texture_key = 'hole_filled' if active else 'hole_empty'
+            elif terrain == TerrainType.NO_CARRY:
+                texture_key = 'no_carry_bg'
+                dynamic_cells.append((gx, gy, terrain, False))  # Need NO_CARRY rendering
+            elif terrain == TerrainType.GOAL:
+                # Flashing goal is drawn in immediate mode; a settled goal is a plain
+                # yellow tile. The label is always dynamic.
+                if not goal_active:
+                    texture_key = 'yellow'
+                dynamic_cells.append((gx, gy, terrain, goal_active))
+            else:
+                texture_key = 'white'
+
+            # Create sprite if static (GPU scales the shared base texture)
+            if texture_key:
+                sprite = arcade.BasicSprite(self._unit_white, scale=scale,
+                                            center_x=center_x, center_y=center_y)
+                sprite.color = TERRAIN_TILE_COLORS[texture_key]
+                sprites.append(sprite)
+            if switch_mark:
+                mark = arcade.BasicSprite(self._unit_white, scale=switch_mark_scale,
+                                          center_x=center_x, center_y=center_y)
+                mark.color = SWITCH_INNER
+                sprites.append(mark)
 
         return sprites, dynamic_cells
 
     def _draw_dynamic_terrain(self, start_x: int, start_y: int, state: BranchState,
-                              cell_size: int, dynamic_cells: list, has_branched: bool, alpha: float = 1.0,
-                              terrain_diff_reference: Optional[BranchState] = None,
-                              terrain_type_filter: Optional[str] = None):
+                              cell_size: int, dynamic_cells: list, has_branched: bool, alpha: float = 1.0):
         """Draw dynamic terrain elements (Goal flash, branch markers).
 
-        Args:
-            terrain_diff_reference: If provided, only draw cells where terrain differs from reference.
-            terrain_type_filter: "static" or "variable" or None (all).
+        dynamic_cells comes from _build_terrain_spritelist; this is the only
+        pass over them.
         """
-        scale = cell_size / CELL_SIZE
+        m = self._get_metrics(cell_size)
+        inner_size = cell_size - m.inset * 2
+        origins, centers = self._get_cell_offsets(cell_size)
+
+        # Alpha-applied colors shared by every cell in this pass
+        a = int(alpha * 255)
+        yellow_a = (*YELLOW, a)
+        green_a = (*GREEN, a)
+        marker_a = (*GRAY, a) if has_branched else green_a
 
         for gx, gy, terrain, extra in dynamic_cells:
-            cell_x = start_x + gx * cell_size
-            cell_y = start_y + gy * cell_size
-            center_x, center_y = self._grid_to_screen(start_x, start_y, gx, gy, cell_size)
+            cell_x = start_x + origins[gx]
+            cell_y = start_y + origins[gy]
+            center_x = start_x + centers[gx]
+            center_y = WINDOW_HEIGHT - (start_y + centers[gy])
 
             if terrain == TerrainType.GOAL:
                 goal_active = extra
                 if goal_active:
-                    flash = int((time.time() * 1000 / 300) % 2)
-                    color = (255, 255, 100, int(alpha * 255)) if flash else (*YELLOW, int(alpha * 255))
+                    color = (255, 255, 100, a) if self._flash_phase else yellow_a
                     self._draw_rect_filled(cell_x, cell_y, cell_size, cell_size, color)
-                    inset = max(1, int(3 * scale))
                     self._draw_rect_outline(
-                        cell_x + inset, cell_y + inset,
-                        cell_size - inset * 2, cell_size - inset * 2,
-                        (*GREEN, int(alpha * 255)), max(1, int(4 * scale))
+                        cell_x + m.inset, cell_y + m.inset,
+                        inner_size, inner_size, green_a, m.goal_outline
                     )
-                else:
-                    self._draw_rect_filled(cell_x, cell_y, cell_size, cell_size, (*YELLOW, int(alpha * 255)))
-                self._draw_cached_text(f'goal_{scale:.2f}_{alpha:.2f}', 'Goal', center_x, center_y,
-                                       (*BLACK, int(alpha * 255)), font_size=int(14 * scale))
+                # Settled goal fill is part of the terrain SpriteList
+                self._draw_cached_text(TEXT_GOAL, 'Goal', center_x, center_y,
+                                       (*BLACK, a), font_size=m.font_size)
 
-            elif terrain in (TerrainType.BRANCH1, TerrainType.BRANCH2,
-                            TerrainType.BRANCH3, TerrainType.BRANCH4):
+            elif terrain in ViewModelBuilder.BRANCH_TERRAINS:
                 is_highlighted = extra
-                if is_highlighted:
-                    self._draw_branch_marker(center_x, center_y, terrain, (*GREEN, int(alpha * 255)), cell_size)
-                else:
-                    color = (*GRAY, int(alpha * 255)) if has_branched else (*GREEN, int(alpha * 255))
-                    self._draw_branch_marker(center_x, center_y, terrain, color, cell_size)
-            elif terrain == TerrainType.SWITCH:
-                is_active = bool(extra)
-                if terrain_diff_reference is not None:
-                    # Diff-only switch overlay: outline only
-                    if is_active:
-                        color = (0, 200, 0, int(alpha * 255))
-                    else:
-                        color = (*SWITCH_OFF_BORDER, int(alpha * 255))
-                    inset = max(1, int(3 * scale))
-                    self._draw_rect_outline(
-                        cell_x + inset, cell_y + inset,
-                        cell_size - inset * 2, cell_size - inset * 2,
-                        color, max(1, int(3 * scale))
-                    )
-                elif not is_active:
-                    # Draw center square in terrain phase so it stays under player/entity layers.
-                    inner = max(4, int(cell_size * 0.28))
-                    ox = cell_x + (cell_size - inner) // 2
-                    oy = cell_y + (cell_size - inner) // 2
-                    self._draw_rect_filled(ox, oy, inner, inner, (*SWITCH_INNER, int(alpha * 255)))
-
-        # Draw NO_CARRY markers
-        for gx in range(self.grid_size):
-            for gy in range(self.grid_size):
-                pos = (gx, gy)
-                terrain = state.terrain.get(pos, TerrainType.FLOOR)
-
-                # Filter by terrain type if requested
-                if terrain_type_filter is not None:
-                    is_variable = terrain in (TerrainType.SWITCH, TerrainType.HOLE)
-                    if terrain_type_filter == "static" and is_variable:
-                        continue
-                    elif terrain_type_filter == "variable" and not is_variable:
-                        continue
-
-                # Filter: only draw cells that differ from reference (if provided)
-                if terrain_diff_reference is not None:
-                    ref_terrain = terrain_diff_reference.terrain.get(pos, TerrainType.FLOOR)
-                    # Only check terrain type for these static decorations
-                    if terrain == ref_terrain:
-                        continue  # Same terrain - skip
-
-                if terrain == TerrainType.NO_CARRY:
-                    pass
+                color = green_a if is_highlighted else marker_a
+                self._draw_branch_marker(center_x, center_y, terrain, color, cell_size)
 
     def draw_preview(self, state: 'BranchState', start_x: int, start_y: int, cell_size: int):
         """Draw a static level preview for the menu.
@@ -419,12 +669,15 @@ class ArcadeRenderer:
         start_x / start_y use the same top-down convention as all other draw methods.
         """
         self.set_grid_size(state.grid_size)
+        self._signature_memo.clear()
+        self._index_memo.clear()
 
         # Terrain — SpriteList path (same as _draw_branch)
         terrain_sprites, dynamic_cells = self._build_terrain_spritelist(
             state, start_x, start_y, cell_size,
             goal_active=False, has_branched=False, highlight_branch_point=False,
         )
+        terrain_sprites.alpha = 255
         terrain_sprites.draw()
         self._draw_dynamic_terrain(start_x, start_y, state, cell_size,
                                    dynamic_cells, has_branched=False)
@@ -435,7 +688,7 @@ class ArcadeRenderer:
                 self._draw_entity(start_x, start_y, e, state, cell_size, is_focused=True)
 
         # Player — same colour logic as _draw_branch (focused, not holding)
-        held_items = state.get_held_items()
+        held_items = self._entity_index(state)[2]
         held_uid = held_items[0] if held_items else None
         if held_uid:
             player_color = BOX_COLORS[(held_uid - 1) % len(BOX_COLORS)]
@@ -459,11 +712,12 @@ class ArcadeRenderer:
             'converge': True,
             'fetch': True,
         }
+        self._flash_phase = int((time.time() * 1000 / 300) % 2)
+        self._signature_memo.clear()
+        self._index_memo.clear()
 
-        # 1. Clear screen
-        arcade.draw_lrbt_rectangle_filled(
-            0, WINDOW_WIDTH, 0, WINDOW_HEIGHT, DARK_BG
-        )
+        # 1. Clear screen (framebuffer clear rather than a full-screen quad)
+        arcade.get_window().clear(color=DARK_BG)
 
         # 2. Draw branches
         # Merge preview mode: draw focused first (opaque), then non-focused on top (transparent)
@@ -477,15 +731,15 @@ class ArcadeRenderer:
             in_merge_preview = both_centered and has_transparency
 
         if in_merge_preview:
-            # Merge preview: 3-layer optimized rendering
+            # Merge preview: terrain once, then entities ordered by focus
             focused_branch = spec.main_branch if spec.current_focus == 0 else spec.sub_branch
             non_focused_branch = spec.sub_branch if spec.current_focus == 0 else spec.main_branch
             hidden_main = spec.main_branch.state
             hidden_sub = spec.sub_branch.state
 
-            # Layer 1: Static terrain only (FLOOR, WALL, GOAL, BRANCH*, NO_CARRY)
-            # Draw once from focused branch (static terrain is same in both branches)
-            # Draw focused title here
+            # Layer 1: Terrain from focused branch (opaque) + focused title.
+            # Static terrain is the same in both branches; SWITCH/HOLE state comes
+            # from the focused branch. One pass covers both static and variable cells.
             self._draw_branch(
                 focused_branch,
                 goal_active=spec.goal_active,
@@ -494,32 +748,14 @@ class ArcadeRenderer:
                 skip_terrain=False,
                 skip_entities=True,
                 skip_decorations=False,  # Draw focused title
-                terrain_type_filter="static",  # Only static terrain
-                hidden_main=hidden_main,
-                hidden_sub=hidden_sub,
-                current_focus=spec.current_focus,
-                falling_boxes=spec.falling_boxes
-            )
-
-            # Layer 2: Variable terrain (SWITCH, HOLE states)
-            # 2a: Focused variable terrain (opaque)
-            self._draw_branch(
-                focused_branch,
-                goal_active=spec.goal_active,
-                has_branched=spec.has_branched,
-                animation_frame=spec.animation_frame,
-                skip_terrain=False,
-                skip_entities=True,
-                skip_decorations=True,  # Skip title (already drawn)
-                terrain_type_filter="variable",  # Only variable terrain
                 hidden_main=hidden_main,
                 hidden_sub=hidden_sub,
                 current_focus=spec.current_focus,
                 falling_boxes=spec.falling_boxes
             )
 
-            # Layer 3: Entities (layered)
-            # 3a: Non-focused entities (transparent)
+            # Layer 2: Entities (layered)
+            # 2a: Non-focused entities (transparent)
             self._draw_branch(
                 non_focused_branch,
                 goal_active=spec.goal_active,
@@ -534,7 +770,7 @@ class ArcadeRenderer:
                 falling_boxes=spec.falling_boxes
             )
 
-            # 3b: Focused entities (opaque, on top)
+            # 2b: Focused entities (opaque, on top)
             self._draw_branch(
                 focused_branch,
                 goal_active=spec.goal_active,
@@ -550,7 +786,7 @@ class ArcadeRenderer:
                 show_fetch_ring=spec.show_fetch_indicator
             )
 
-            # Layer 4: Merge convergence hints (when focused is holding)
+            # Layer 3: Merge convergence hints (when focused is holding)
             # Shows where other branch's items will converge to focused position
             if self.current_hints.get('converge', True):
                 cell_size = self._scaled_cell_size(focused_branch.scale)
@@ -562,7 +798,8 @@ class ArcadeRenderer:
                 )
         else:
             # Normal mode: draw in standard order
-            if spec.sub_branch and -500 < spec.sub_branch.pos_x < WINDOW_WIDTH + 100:
+            # Off-screen panels are culled inside _draw_branch
+            if spec.sub_branch:
                 self._draw_branch(
                     spec.sub_branch,
                     goal_active=spec.goal_active,
@@ -572,15 +809,14 @@ class ArcadeRenderer:
                     show_fetch_ring=spec.show_fetch_indicator and spec.current_focus == 1
                 )
 
-            if -500 < spec.main_branch.pos_x < WINDOW_WIDTH + 100:
-                self._draw_branch(
-                    spec.main_branch,
-                    goal_active=spec.goal_active,
-                    has_branched=spec.has_branched,
-                    animation_frame=spec.animation_frame,
-                    falling_boxes=spec.falling_boxes,
-                    show_fetch_ring=spec.show_fetch_indicator and spec.current_focus == 0
-                )
+            self._draw_branch(
+                spec.main_branch,
+                goal_active=spec.goal_active,
+                has_branched=spec.has_branched,
+                animation_frame=spec.animation_frame,
+                falling_boxes=spec.falling_boxes,
+                show_fetch_ring=spec.show_fetch_indicator and spec.current_focus == 0
+            )
 
         # 2.5. Draw flash effect on focused branch
         if spec.flash_pos and spec.flash_intensity > 0:
@@ -624,7 +860,10 @@ class ArcadeRenderer:
         self._help_hint.draw()
 
     def _flip_y(self, y: int) -> int:
-        """Convert top-down Y to arcade's bottom-up Y."""
+        """Convert top-down Y to arcade's bottom-up Y.
+
+        Per-cell hot paths inline this as WINDOW_HEIGHT - y.
+        """
         return WINDOW_HEIGHT - y
 
     def _scaled_cell_size(self, scale: float) -> int:
@@ -635,9 +874,9 @@ class ArcadeRenderer:
     def _grid_to_screen(self, start_x: int, start_y: int,
                         grid_x: int, grid_y: int, cell_size: int) -> Tuple[int, int]:
         """Convert grid position to screen center coordinates."""
-        screen_x = start_x + grid_x * cell_size + cell_size // 2
-        screen_y = self._flip_y(start_y + grid_y * cell_size + cell_size // 2)
-        return screen_x, screen_y
+        half = cell_size // 2
+        return (start_x + grid_x * cell_size + half,
+                WINDOW_HEIGHT - (start_y + grid_y * cell_size + half))
 
     def _draw_branch(self, spec: 'BranchViewSpec', goal_active: bool,
                      has_branched: bool, animation_frame: int,
@@ -647,16 +886,12 @@ class ArcadeRenderer:
                      skip_terrain: bool = False,
                      skip_entities: bool = False,
                      skip_decorations: bool = False,
-                     terrain_diff_reference: Optional[BranchState] = None,
-                     terrain_type_filter: Optional[str] = None,
                      override_pos: Optional[Tuple[int, int]] = None,
                      falling_boxes: dict = None,
                      show_fetch_ring: bool = False):
         """Draw a single branch panel.
 
         Args:
-            terrain_diff_reference: If provided, only draw terrain cells that differ from this reference.
-            terrain_type_filter: "static" or "variable" or None (all).
             skip_decorations: If True, skip title and border drawing.
         """
         state = spec.state
@@ -671,6 +906,11 @@ class ArcadeRenderer:
         grid_width = cell_size * self.grid_size
         grid_height = cell_size * self.grid_size
 
+        # Panel slid fully out of the window: skip terrain build and entity work.
+        # Everything drawn below (title included) lies within the panel's columns.
+        if start_x + grid_width <= 0 or start_x >= WINDOW_WIDTH:
+            return
+
         # Title and Border (skip if decorations disabled)
         if not skip_decorations:
             # Title - always centered above first cell (standard configuration)
@@ -689,7 +929,7 @@ class ArcadeRenderer:
             anchor_x = "center"
 
             self._draw_cached_text(
-                f'title_{spec.title}_{font_size}_{spec.alpha:.2f}', spec.title, title_x, title_y,
+                TEXT_TITLE, spec.title, title_x, title_y,
                 (200, 200, 200, int(spec.alpha * 255)), font_size=font_size, anchor_x=anchor_x, anchor_y="center"
             )
 
@@ -705,14 +945,12 @@ class ArcadeRenderer:
         if not skip_terrain:
             terrain_sprites, dynamic_cells = self._build_terrain_spritelist(
                 state, start_x, start_y, cell_size,
-                goal_active, has_branched, spec.highlight_branch_point,
-                terrain_diff_reference, terrain_type_filter
+                goal_active, has_branched, spec.highlight_branch_point
             )
             terrain_sprites.alpha = int(spec.alpha * 255)
             terrain_sprites.draw()
             self._draw_dynamic_terrain(start_x, start_y, state, cell_size,
-                                       dynamic_cells, has_branched, spec.alpha,
-                                       terrain_diff_reference, terrain_type_filter)
+                                       dynamic_cells, has_branched, spec.alpha)
 
         # Entities (boxes) - skip if requested
         if not skip_entities:
@@ -728,26 +966,23 @@ class ArcadeRenderer:
                 if len(uids) >= 2
             }
 
+            # Panel-level flags, folded once rather than per entity
+            full_focus = spec.is_focused and spec.scale >= 1.0
+            fade_pos = None
+            if self.peek_floor_mode and full_focus:
+                fade_pos = (state.player.pos[0] + state.player.direction[0],
+                            state.player.pos[1] + state.player.direction[1])
+
             for e in sorted(state.entities, key=lambda e: e.z):
                 if e.uid != 0 and e.type == EntityType.BOX:
-                    fade_front = (
-                        self.peek_floor_mode
-                        and spec.is_focused
-                        and spec.scale >= 1.0
-                        and e.z == 0
-                        and e.pos == (state.player.pos[0] + state.player.direction[0],
-                                      state.player.pos[1] + state.player.direction[1])
-                    )
+                    fade_front = e.z == 0 and e.pos == fade_pos
                     self._draw_entity(start_x, start_y, e, state, cell_size, spec.alpha,
                                       spec.border_color, spec.is_focused, falling_boxes,
                                       overlap_labels, fade_front)
 
-            # Shadow connections (only on focused, full-scale branch)
-            if spec.is_focused and spec.scale >= 1.0:
+            # Shadow connections and grounded lock frame (focused, full-scale only)
+            if full_focus:
                 self._draw_shadow_connections(start_x, start_y, state, animation_frame, cell_size)
-
-            # Grounded object lock frame (only on focused, full-scale branch)
-            if spec.is_focused and spec.scale >= 1.0:
                 self._draw_grounded_object_lock(start_x, start_y, state, cell_size)
 
             # fetched hold hint (merge preview only, fetch hints unlocked)
@@ -760,9 +995,9 @@ class ArcadeRenderer:
                 )
 
             # Player
-            held_items = state.get_held_items()
+            _, by_uid, held_items = self._entity_index(state)
             held_uid = held_items[0] if held_items else None
-            held_entity = next((e for e in state.entities if e.uid == held_uid), None) if held_uid else None
+            held_entity = by_uid[held_uid][0] if held_uid else None
             held_label = ('+'.join(str(u) for u in sorted(held_entity.fused_from)) if held_entity and held_entity.fused_from
                           else str(held_uid) if held_uid else None)
             if held_uid:
@@ -779,7 +1014,7 @@ class ArcadeRenderer:
                               show_fetch_ring=show_fetch_ring,
                               held_label=held_label)
 
-        # Cell hint (only for focused, full-scale)
+        # Cell hint (only for focused, full-scale; drawn with the entity layer)
         # Converge hint uses 'converge' lock; pickup/drop uses 'pickup' lock.
         is_converge_hint = (
             spec.interaction_hint is not None
@@ -791,6 +1026,7 @@ class ArcadeRenderer:
             else self.current_hints.get('pickup', True)
         )
         if (spec.interaction_hint and spec.scale >= 1.0
+            and not skip_entities
             and hint_unlocked
             and not self.peek_floor_mode):
             self._draw_cell_hint(start_x, start_y, spec.interaction_hint, cell_size, spec.alpha)
@@ -818,38 +1054,68 @@ class ArcadeRenderer:
     def _draw_rect_outline(self, x: int, y: int, w: int, h: int,
                            color: Tuple, thickness: int):
         """Draw rectangle outline (top-down coordinates)."""
-        # Convert to arcade coordinates (bottom-left origin)
-        left = x
-        right = x + w
-        top = self._flip_y(y)
-        bottom = self._flip_y(y + h)
-        arcade.draw_lrbt_rectangle_outline(left, right, bottom, top, color, thickness)
+        # Convert to arcade coordinates (bottom-left origin); _flip_y inlined
+        top = WINDOW_HEIGHT - y
+        arcade.draw_lrbt_rectangle_outline(x, x + w, top - h, top, color, thickness)
 
     def _draw_rect_filled(self, x: int, y: int, w: int, h: int, color: Tuple):
         """Draw filled rectangle (top-down coordinates)."""
-        left = x
-        right = x + w
-        top = self._flip_y(y)
-        bottom = self._flip_y(y + h)
-        arcade.draw_lrbt_rectangle_filled(left, right, bottom, top, color)
+        top = WINDOW_HEIGHT - y
+        arcade.draw_lrbt_rectangle_filled(x, x + w, top - h, top, color)
 
     def _draw_branch_marker(self, cx: int, cy: int, terrain: TerrainType,
                             color: Tuple, cell_size: int):
         """Draw concentric circles for branch point."""
-        uses = {
-            TerrainType.BRANCH1: 1, TerrainType.BRANCH2: 2,
-            TerrainType.BRANCH3: 3, TerrainType.BRANCH4: 4
-        }[terrain]
-
+        if len(color) > 3 and color[3] != 255:
+            # Fading panels change alpha every frame; don't churn the cache
+            self._draw_branch_marker_immediate(cx, cy, terrain, color, cell_size)
+            return
+        key = (terrain, cell_size, color)
+        shapes = self._marker_cache.get(key)
+        if shapes is None:
+            shapes = self._create_branch_marker(terrain, color, cell_size)
+            self._marker_cache[key] = shapes
+            if len(self._marker_cache) > MARKER_CACHE_SIZE:
+                self._marker_cache.popitem(last=False)
+        else:
+            self._marker_cache.move_to_end(key)
+        shapes.center_x = cx
+        shapes.center_y = cy
+        shapes.draw()
+
+    @staticmethod
+    def _branch_marker_rings(terrain: TerrainType, cell_size: int) -> tuple:
+        """(ring radii, outermost first, line width, base radius) for a branch point."""
+        uses = BRANCH_USES[terrain]
         base_radius = cell_size // 6
         ring_spacing = int(6 * cell_size / CELL_SIZE)
         line_width = max(1, int(3 * cell_size / CELL_SIZE))
-
-        for i in range(uses - 1, 0, -1):
-            radius = base_radius + i * ring_spacing
+        radii = tuple(base_radius + i * ring_spacing for i in range(uses - 1, 0, -1))
+        return radii, line_width, base_radius
+
+    def _draw_branch_marker_immediate(self, cx: int, cy: int, terrain: TerrainType,
+                                      color: Tuple, cell_size: int):
+        """Draw branch-point rings without caching (translucent colors)."""
+        radii, line_width, base_radius = self._branch_marker_rings(terrain, cell_size)
+        for radius in radii:
             arcade.draw_circle_outline(cx, cy, radius, color, line_width)
         arcade.draw_circle_filled(cx, cy, base_radius, color)
 
+    def _create_branch_marker(self, terrain: TerrainType, color: Tuple,
+                              cell_size: int) -> ShapeElementList:
+        """Build branch-point rings centered on the origin as one batched shape."""
+        radii, line_width, base_radius = self._branch_marker_rings(terrain, cell_size)
+
+        shapes = ShapeElementList()
+        for radius in radii:
+            # create_ellipse_outline ignores its width (1px line strip); tessellate the band
+            points = ring_strip_points(radius, line_width)
+            shapes.append(create_triangles_strip_filled_with_colors(
+                points, [color] * len(points)
+            ))
+        shapes.append(create_ellipse_filled(0, 0, base_radius * 2, base_radius * 2, color))
+        return shapes
+
     def _draw_entity(self, start_x: int, start_y: int, entity,
                      state: BranchState, cell_size: int, alpha: float = 1.0,
                      branch_color: Tuple[int, int, int] = None,
@@ -858,20 +1124,20 @@ class ArcadeRenderer:
                      overlap_labels: dict = None,
                      fade_front: bool = False):
         """Draw a single entity (box)."""
-        scale = cell_size / CELL_SIZE
+        m = self._get_metrics(cell_size)
 
         # Calculate padding with falling animation
         # Normal box: padding = 9, In-hole box: padding = 15
-        base_padding = 15 if entity.z == -1 else 9
 
         # Check if this specific box instance is currently falling (animating into hole)
         instance_key = (entity.uid, entity.pos)
-        if falling_boxes and instance_key in falling_boxes:
+        falling = bool(falling_boxes) and instance_key in falling_boxes
+        if falling:
             progress = falling_boxes[instance_key]  # 0.0 to 1.0
-            # Interpolate from normal (9) to in-hole (15)
-            padding = int((9 + (15 - 9) * progress) * scale)
+            # Interpolate from normal (9) to in-hole (15); progress-dependent, so not a metric
+            padding = int((9 + (15 - 9) * progress) * m.scale)
         else:
-            padding = int(base_padding * scale)
+            padding = m.hole_padding if entity.z == -1 else m.box_padding
 
         gx, gy = entity.pos
         cell_x = start_x + gx * cell_size + padding
@@ -888,17 +1154,15 @@ class ArcadeRenderer:
         # Apply desaturation
         if is_transparent_branch:
             # Light desaturation for transparent branch in merge preview
-            display_color = desaturate_color(base_color, 0.3)
+            display_color = PREVIEW_BOX_COLORS[color_index]
         elif is_shadow and not is_focused:
-            display_color = desaturate_color(base_color, 0.5)
+            display_color = SHADOW_BOX_COLORS[color_index]
         else:
             display_color = base_color
 
         effective_alpha = alpha * (0.18 if fade_front else 1.0)
-        display_color = (*display_color, int(effective_alpha * 255))
-
-        # Fill
-        self._draw_rect_filled(cell_x, cell_y, box_size, box_size, display_color)
+        a = int(effective_alpha * 255)
+        display_color = (*display_color, a)
 
         # Border color and style
         if is_transparent_branch:
@@ -907,21 +1171,23 @@ class ArcadeRenderer:
             border_thickness = 0
         else:
             # Normal black border
-            border_color = (*BLACK, int(effective_alpha * 255))
-            border_thickness = max(1, int(2 * scale))
-
-        # Border (dashed for shadow, solid otherwise, none for transparent overlay)
-        if border_thickness > 0 and border_color is not None:
-            if is_shadow:
-                self._draw_dashed_rect(cell_x, cell_y, box_size, box_size,
-                                      border_color, border_thickness)
-            else:
-                self._draw_rect_outline(cell_x, cell_y, box_size, box_size,
-                                       border_color, border_thickness)
+            border_color = (*BLACK, a)
+            border_thickness = m.border
+
+        # Fill + border (dashed for shadow, solid otherwise, none for transparent
+        # overlay), drawn before the label to keep z-order. Fading or falling
+        # boxes change color/size every frame, so only settled ones are cached.
+        self._draw_box_body(cell_x, cell_y, box_size, display_color, border_color,
+                            border_thickness, is_shadow and box_size >= MIN_DASHED_BOX_SIZE,
+                            cached=a == 255 and not falling)
+
+        font_size = m.font_size
+        if font_size < MIN_LABEL_FONT_SIZE:
+            return
 
         # UID text: check for unfused overlap (other grounded boxes at same pos)
         center_x = cell_x + box_size // 2
-        center_y = self._flip_y(cell_y + box_size // 2)
+        center_y = WINDOW_HEIGHT - (cell_y + box_size // 2)
 
         if entity.fused_from:
             label = '+'.join(str(u) for u in sorted(entity.fused_from))
@@ -930,37 +1196,67 @@ class ArcadeRenderer:
         else:
             label = str(entity.uid)
 
-        font_size = int(14 * scale)
-        text_alpha = max(0, int(effective_alpha * 255) - 40) if fade_front else int(effective_alpha * 255)
-        self._draw_cached_text(f'uid_{label}_{scale:.2f}_{effective_alpha:.2f}', label,
+        text_alpha = max(0, a - 40) if fade_front else a
+        self._draw_cached_text(TEXT_UID, label,
                                center_x, center_y, (*BLACK, text_alpha), font_size=font_size)
 
+    def _draw_box_body(self, x: int, y: int, box_size: int, fill_color: Tuple,
+                       border_color: Optional[Tuple], border_thickness: int,
+                       dashed: bool, cached: bool = True):
+        """Draw a box fill + optional border at top-down (x, y).
+
+        cached=False draws immediately; use it for per-frame values (alpha
+        fades, fall animation) that would only churn the shape cache.
+        """
+        if cached:
+            shapes = self._get_box_shape(box_size, fill_color, border_color,
+                                         border_thickness, dashed)
+            shapes.center_x = x + box_size / 2
+            shapes.center_y = WINDOW_HEIGHT - (y + box_size / 2)
+            shapes.draw()
+            return
+        self._draw_rect_filled(x, y, box_size, box_size, fill_color)
+        if border_thickness > 0 and border_color is not None:
+            if dashed:
+                self._draw_dashed_rect(x, y, box_size, box_size, border_color, border_thickness)
+            else:
+                self._draw_rect_outline(x, y, box_size, box_size, border_color, border_thickness)
+
+    def _get_box_shape(self, box_size: int, fill_color: Tuple, border_color: Optional[Tuple],
+                       border_thickness: int, dashed: bool) -> ShapeElementList:
+        """Get cached box body (fill + optional border) centered on the origin."""
+        key = (box_size, fill_color, border_color, border_thickness, dashed)
+        shapes = self._box_shape_cache.get(key)
+        if shapes is not None:
+            self._box_shape_cache.move_to_end(key)
+            return shapes
+
+        shapes = ShapeElementList()
+        shapes.append(create_rectangle_filled(0, 0, box_size, box_size, fill_color))
+        if border_thickness > 0 and border_color is not None:
+            if dashed:
+                # create_lines is 1px GL_LINES; tessellate each dash to keep the width
+                half = box_size / 2
+                points = dashed_rect_points(box_size, box_size)
+                for i in range(0, len(points), 2):
+                    (x1, y1), (x2, y2) = points[i], points[i + 1]
+                    shapes.append(create_line(x1 - half, y1 + half, x2 - half, y2 + half,
+                                              border_color, border_thickness))
+            else:
+                shapes.append(create_rectangle_outline(0, 0, box_size, box_size,
+                                                       border_color, border_thickness))
+        self._box_shape_cache[key] = shapes
+        if len(self._box_shape_cache) > BOX_SHAPE_CACHE_SIZE:
+            self._box_shape_cache.popitem(last=False)
+        return shapes
+
     def _draw_dashed_rect(self, x: int, y: int, w: int, h: int,
                           color: Tuple, thickness: int):
-        """Draw dashed rectangle outline."""
-        dash_len = 5
-        gap_len = 5
-
-        # Top edge
-        for i in range(0, w, dash_len + gap_len):
-            end_i = min(i + dash_len, w)
-            arcade.draw_line(x + i, self._flip_y(y),
-                           x + end_i, self._flip_y(y), color, thickness)
-        # Bottom edge
-        for i in range(0, w, dash_len + gap_len):
-            end_i = min(i + dash_len, w)
-            arcade.draw_line(x + i, self._flip_y(y + h),
-                           x + end_i, self._flip_y(y + h), color, thickness)
-        # Left edge
-        for i in range(0, h, dash_len + gap_len):
-            end_i = min(i + dash_len, h)
-            arcade.draw_line(x, self._flip_y(y + i),
-                           x, self._flip_y(y + end_i), color, thickness)
-        # Right edge
-        for i in range(0, h, dash_len + gap_len):
-            end_i = min(i + dash_len, h)
-            arcade.draw_line(x + w, self._flip_y(y + i),
-                           x + w, self._flip_y(y + end_i), color, thickness)
+        """Draw dashed rectangle outline in a single batched line draw."""
+        top = WINDOW_HEIGHT - y
+        points = [(x + px, top + py) for px, py in dashed_rect_points(w, h)]
+        if points:
+            arcade.draw_lines(points, color, thickness)
 
     def _draw_player(self, start_x: int, start_y: int, player,
                      color: Tuple, held_uid: Optional[int], cell_size: int, alpha: float = 1.0,
@@ -971,12 +1267,12 @@ class ArcadeRenderer:
         Args:
             show_fetch_ring: Reserved for fetch-state visual effects.
         """
-        scale = cell_size / CELL_SIZE
+        m = self._get_metrics(cell_size)
         gx, gy = player.pos
         center_x, center_y = self._grid_to_screen(start_x, start_y, gx, gy, cell_size)
 
         dx, dy = player.direction
-        offset = int(8 * scale)
+        offset = m.arrow_offset
         arrow_cx = center_x + dx * offset
         arrow_cy = center_y - dy * offset  # Flip Y for arrow
 
@@ -984,7 +1280,7 @@ class ArcadeRenderer:
 
         if held_uid is not None:
             # Draw box-shaped player
-            pad = int(5 * scale)
+            pad = m.player_pad
             cell_x = start_x + gx * cell_size + pad
             cell_y = start_y + gy * cell_size + pad
             box_size = cell_size - pad * 2
@@ -992,81 +1288,118 @@ class ArcadeRenderer:
             self._draw_rect_filled(cell_x, cell_y, box_size, box_size, player_color)
             if show_border:
                 self._draw_rect_outline(cell_x, cell_y, box_size, box_size,
-                                       (*BLACK, int(alpha * 255)), max(1, int(3 * scale)))
+                                       (*BLACK, int(alpha * 255)), m.outline)
 
             # UID text (cached)
             label = held_label if held_label is not None else str(held_uid)
-            self._draw_cached_text(f'held_{label}_{scale:.2f}_{alpha:.2f}', label,
-                                   center_x, center_y, (*BLACK, int(alpha * 255)), font_size=int(14 * scale))
+            self._draw_cached_text(TEXT_HELD, label,
+                                   center_x, center_y, (*BLACK, int(alpha * 255)), font_size=m.font_size)
 
             # Arrow
             if show_arrow:
-                arrow_size = int(21 * scale)
+                arrow_size = m.arrow_size
                 self._draw_arrow(arrow_cx, arrow_cy, dx, -dy, arrow_size, (*BLACK, int(alpha * 255)))
         else:
             # Draw circle player
-            radius = cell_size // 5
+            radius = m.player_radius
             if tuple(color[:3]) == GRAY:
                 # Inactive branch player: use blue-gray ring to avoid blending with gray switch tiles.
                 ring_color = (*PLAYER_RING_BLUE_GRAY, int(alpha * 255))
-                ring_width = max(2, int(3 * scale))
+                ring_width = m.ring_width
                 arcade.draw_circle_outline(center_x, center_y, radius, ring_color, ring_width)
             else:
                 arcade.draw_circle_filled(center_x, center_y, radius, player_color)
 
             if show_arrow:
-                arrow_size = int(21 * scale)
+                arrow_size = m.arrow_size
                 self._draw_arrow(arrow_cx, arrow_cy, dx, -dy, arrow_size, (*BLACK, int(alpha * 255)))
 
     def _draw_arrow(self, cx: int, cy: int, dx: int, dy: int,
                     size: int, color: Tuple):
         """Draw a triangular arrow."""
-        half = size // 2
-        if dy == 1:  # Up (screen)
-            points = [(cx, cy + size), (cx - half, cy + half), (cx + half, cy + half)]
-        elif dy == -1:  # Down (screen)
-            points = [(cx, cy - size), (cx - half, cy - half), (cx + half, cy - half)]
-        elif dx == -1:  # Left
-            points = [(cx - size, cy), (cx - half, cy - half), (cx - half, cy + half)]
-        else:  # Right
-            points = [(cx + size, cy), (cx + half, cy - half), (cx + half, cy + half)]
-        arcade.draw_polygon_filled(points, color)
+        (x1, y1), (x2, y2), (x3, y3) = arrow_offsets(dx, dy, size)
+        arcade.draw_triangle_filled(cx + x1, cy + y1, cx + x2, cy + y2, cx + x3, cy + y3, color)
 
     def _draw_grid_lines(self, start_x: int, start_y: int,
                          state: BranchState, cell_size: int, alpha: float = 1.0):
-        """Draw grid lines."""
-        scale = cell_size / CELL_SIZE
-
-        for gx in range(self.grid_size):
-            for gy in range(self.grid_size):
-                pos = (gx, gy)
-                cell_x = start_x + gx * cell_size
-                cell_y = start_y + gy * cell_size
+        """Draw grid outlines and switch borders, from cached shape batches when opaque.
 
-                terrain = state.terrain.get(pos)
-
-                if terrain == TerrainType.SWITCH:
-                    activated = state.switch_activated(pos)
-                    if activated:
-                        color = (*SWITCH_ON_BORDER, int(alpha * 255))
-                    else:
-                        color = (*SWITCH_INNER, int(alpha * 255))
-                    inset = max(1, int(3 * scale))
-                    self._draw_rect_outline(
-                        cell_x + inset, cell_y + inset,
-                        cell_size - inset * 2, cell_size - inset * 2,
-                        color, max(1, int(3 * scale))
+        Cell outlines depend only on the terrain layout, so box moves reuse
+        them; switch borders (whose color follows pressed state) are a
+        separate, much smaller batch keyed by the full terrain signature.
+        Panels mid-fade change alpha every frame, so they draw immediately
+        rather than rebuilding geometry per frame.
+        """
+        a = int(alpha * 255)
+        top = WINDOW_HEIGHT - start_y
+        if a != 255:
+            for rects in (self._grid_outline_rects(state, cell_size),
+                          self._switch_border_rects(state, cell_size)):
+                for cx, cy, size, rgb, thickness in rects:
+                    half = size / 2
+                    arcade.draw_lrbt_rectangle_outline(
+                        start_x + cx - half, start_x + cx + half,
+                        top + cy - half, top + cy + half, (*rgb, a), thickness
                     )
-                elif terrain == TerrainType.WALL:
-                    pass  # black wall absorbs its own border
-                else:
-                    self._draw_rect_outline(cell_x, cell_y, cell_size, cell_size, (*GRAY, int(alpha * 255)), 1)
+            return
+
+        sig = self._terrain_signature(state)
+        outlines = self._cached_shape(self._grid_cache,
+                                      (sig[0], cell_size, self.grid_size),
+                                      self._grid_outline_rects, state, cell_size)
+        switches = self._cached_shape(self._switch_cache,
+                                      (sig, cell_size, self.grid_size),
+                                      self._switch_border_rects, state, cell_size)
+        # Geometry is built relative to the panel's top-left corner
+        for shapes in (outlines, switches):
+            shapes.center_x = start_x
+            shapes.center_y = top
+            shapes.draw()
+
+    @staticmethod
+    def _cached_shape(cache: OrderedDict, key: Hashable, rects_for, *args) -> ShapeElementList:
+        """LRU lookup in a panel shape cache, building opaque outlines on miss."""
+        shapes = cache.get(key)
+        if shapes is None:
+            shapes = ShapeElementList()
+            for cx, cy, size, rgb, thickness in rects_for(*args):
+                shapes.append(create_rectangle_outline(cx, cy, size, size, rgb, thickness))
+            cache[key] = shapes
+            if len(cache) > TERRAIN_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return shapes
+
+    def _grid_outline_rects(self, state: BranchState, cell_size: int) -> list:
+        """(cx, cy, size, rgb, thickness) cell outlines relative to the panel's top-left (y up)."""
+        if cell_size < MIN_GRID_LINE_CELL_SIZE:
+            return []  # tiny cells skip outlines
+        origins, _ = self._get_cell_offsets(cell_size)
+        # Float half, not the integer cell center: odd sizes must span origin..origin + size
+        half = cell_size / 2
+        # Black walls absorb their own border; switches get their own batch
+        return [(origins[gx] + half, -(origins[gy] + half), cell_size, GRAY, 1)
+                for gx, gy, pos, terrain, active in self._terrain_cells(state)
+                if terrain != TerrainType.WALL and terrain != TerrainType.SWITCH]
+
+    def _switch_border_rects(self, state: BranchState, cell_size: int) -> list:
+        """(cx, cy, size, rgb, thickness) switch borders, colored by pressed state."""
+        m = self._get_metrics(cell_size)
+        switch_size = cell_size - m.inset * 2
+        origins, _ = self._get_cell_offsets(cell_size)
+        half = cell_size / 2  # inset is symmetric, so the border shares the cell's float center
+        return [(origins[gx] + half, -(origins[gy] + half), switch_size,
+                 SWITCH_ON_BORDER if active else SWITCH_INNER, m.outline)
+                for gx, gy, pos, terrain, active in self._terrain_cells(state)
+                if terrain == TerrainType.SWITCH]
 
     def _draw_shadow_connections(self, start_x: int, start_y: int,
                                   state: BranchState, animation_frame: int,
                                   cell_size: int):
         """Draw shadow connection effects."""
-        if state.get_held_items():
+        by_pos, by_uid, held = self._entity_index(state)
+        if held:
             return
 
         player = state.player
@@ -1075,36 +1408,33 @@ class ArcadeRenderer:
         front_pos = (px + dx, py + dy)
 
         from timeline_system import Physics
-        entities_at_front = [e for e in state.entities
-                            if e.pos == front_pos and Physics.grounded(e)]
-        if not entities_at_front:
+        front_uids = {e.uid for e in by_pos.get(front_pos, ()) if Physics.grounded(e)}
+        if not front_uids:
             return
 
-        front_uids = {e.uid for e in entities_at_front}
+        front_cx, front_cy = self._grid_to_screen(start_x, start_y,
+                                                  front_pos[0], front_pos[1], cell_size)
+        line_color = (50, 220, 50)
+        slow_offset = animation_frame * 0.25
 
+        # Every connection shares color and width: one batched draw for all
+        points = []
         for uid in front_uids:
             if not state.is_shadow(uid):
                 continue
 
-            all_instances = state.get_entities_by_uid(uid)
-            positions = {e.pos for e in all_instances}
+            positions = {e.pos for e in by_uid[uid]}
 
             if len(positions) <= 1:
                 continue
 
-            other_positions = positions - {front_pos}
-
-            fx, fy = front_pos
-            front_cx, front_cy = self._grid_to_screen(start_x, start_y, fx, fy, cell_size)
-
-            line_color = (50, 220, 50)
-            slow_offset = animation_frame * 0.25
-
-            for pos in other_positions:
-                ox, oy = pos
+            positions.discard(front_pos)
+            for ox, oy in positions:
                 other_cx, other_cy = self._grid_to_screen(start_x, start_y, ox, oy, cell_size)
-                self._draw_dashed_line(other_cx, other_cy, front_cx, front_cy,
-                                       line_color, 3, 12, slow_offset)
+                points += dashed_line_points(other_cx, other_cy, front_cx, front_cy,
+                                             12, slow_offset)
+        if points:
+            arcade.draw_lines(points, line_color, 3)
 
     def _draw_grounded_object_lock(self, start_x: int, start_y: int,
                                     state: BranchState, cell_size: int):
@@ -1116,20 +1446,21 @@ class ArcadeRenderer:
         dx, dy = player.direction
         front_pos = (px + dx, py + dy)
 
-        # Find grounded box at front position
-        target = state.find_box_at(front_pos)
-        if target is None:
+        # Grounded box at front position (same test as state.find_box_at, via the index)
+        by_pos = self._entity_index(state)[0]
+        if not any(e.type == EntityType.BOX and Physics.grounded(e)
+                   for e in by_pos.get(front_pos, ())):
             return
 
         # Draw lock corners around grounded object
-        scale = cell_size / CELL_SIZE
+        m = self._get_metrics(cell_size)
         lock_color = (100, 100, 100)  # Gray lock frame
         self._draw_lock_corners(
             start_x, start_y, front_pos, lock_color,
             cell_size,
-            size=int(20 * scale),
-            thickness=max(2, int(6 * scale)),  # Thicker
-            margin=-int(3 * scale)  # Negative margin = inset to avoid grid lines
+            size=m.lock_size,
+            thickness=m.lock_thickness,  # Thicker
+            margin=m.lock_margin  # Negative margin = inset to avoid grid lines
         )
 
     def _draw_merge_convergence_hints(self, focused_start_x: int, focused_start_y: int,
@@ -1150,7 +1481,7 @@ class ArcadeRenderer:
         from timeline_system import Physics
 
         # Only show hints if focused is holding
-        focused_held = set(focused_state.get_held_items())
+        focused_held = set(self._entity_index(focused_state)[2])
         if not focused_held:
             return
 
@@ -1182,26 +1513,9 @@ class ArcadeRenderer:
                           color: Tuple, width: int = 3, dash_length: int = 9,
                           offset: float = 0):
         """Draw a flowing dashed line."""
-        dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
-        if dist == 0:
-            return
-
-        dx = (x2 - x1) / dist
-        dy = (y2 - y1) / dist
-
-        period = dash_length * 2
-        pos = offset % period
-
-        while pos < dist:
-            seg_start = max(0.0, pos)
-            seg_end = min(dist, pos + dash_length)
-            if seg_end > seg_start:
-                sx = int(x1 + dx * seg_start)
-                sy = int(y1 + dy * seg_start)
-                ex = int(x1 + dx * seg_end)
-                ey = int(y1 + dy * seg_end)
-                arcade.draw_line(sx, sy, ex, ey, color, width)
-            pos += period
+        points = dashed_line_points(x1, y1, x2, y2, dash_length, offset)
+        if points:
+            arcade.draw_lines(points, color, width)
 
     def _draw_fetched_hold_hint(self, start_x: int, start_y: int,
                                    preview_state: BranchState,
@@ -1214,8 +1528,8 @@ class ArcadeRenderer:
         focused = sub_branch if current_focus == 1 else main_branch
         other = main_branch if current_focus == 1 else sub_branch
 
-        other_held = set(other.get_held_items())
-        focused_held = set(focused.get_held_items())
+        other_held = set(self._entity_index(other)[2])
+        focused_held = set(self._entity_index(focused)[2])
         fetched = other_held if not focused_held else set()
 
         if not fetched:
@@ -1223,45 +1537,48 @@ class ArcadeRenderer:
 
         from timeline_system import Physics
 
-        scale = cell_size / CELL_SIZE
+        m = self._get_metrics(cell_size)
         fetch_line_color = ORANGE
         converge_line_color = (50, 220, 50)
         slow_offset = animation_frame * 0.25
 
-        for uid in fetched:
-            ghost_pos = preview_state.player.pos
-            gx, gy = ghost_pos
+        # Per-frame invariants shared by every fetched uid
+        gx, gy = preview_state.player.pos
+        other_px, other_py = other.player.pos
+        other_cx, other_cy = self._grid_to_screen(start_x, start_y, other_px, other_py, cell_size)
+        ghost_cx, ghost_cy = self._grid_to_screen(start_x, start_y, gx, gy, cell_size)
+        pulse = math.sin(animation_frame / 20) * 0.3 + 0.7
+        lock_color = (
+            int(fetch_line_color[0] * pulse),
+            int(fetch_line_color[1] * pulse),
+            int(fetch_line_color[2] * pulse)
+        )
 
+        for uid in fetched:
             # fetch line: other branch player -> focused ghost position
-            other_px, other_py = other.player.pos
-            other_cx, other_cy = self._grid_to_screen(start_x, start_y, other_px, other_py, cell_size)
-            ghost_cx, ghost_cy = self._grid_to_screen(start_x, start_y, gx, gy, cell_size)
             self._draw_dashed_line(other_cx, other_cy, ghost_cx, ghost_cy,
-                                   fetch_line_color, max(1, int(3 * scale)),
-                                   int(12 * scale), slow_offset)
+                                   fetch_line_color, m.outline,
+                                   m.fetch_dash, slow_offset)
 
             # Ghost box
-            pad = int(6 * scale)
+            pad = m.ghost_padding
             cell_x = start_x + gx * cell_size + pad
             cell_y = start_y + gy * cell_size + pad
             box_size = cell_size - pad * 2
 
             color_index = (uid - 1) % len(BOX_COLORS)
-            base_color = BOX_COLORS[color_index]
-            ghost_color = desaturate_color(base_color, 0.7)
+            ghost_color = GHOST_BOX_COLORS[color_index]
 
-            # Semi-transparent fill
-            ghost_color_alpha = (*ghost_color, 128)
-            self._draw_rect_filled(cell_x, cell_y, box_size, box_size, ghost_color_alpha)
-            self._draw_rect_outline(cell_x, cell_y, box_size, box_size,
-                                   ghost_color, max(1, int(3 * scale)))
+            # Semi-transparent fill + solid border (fixed colors, so cacheable)
+            self._draw_box_body(cell_x, cell_y, box_size, (*ghost_color, 128), ghost_color,
+                                m.outline, False)
 
             # UID text (cached)
             center_x = cell_x + box_size // 2
-            center_y = self._flip_y(cell_y + box_size // 2)
-            self._draw_cached_text(f'ghost_{uid}_{scale:.2f}', str(uid),
+            center_y = WINDOW_HEIGHT - (cell_y + box_size // 2)
+            self._draw_cached_text(TEXT_GHOST, str(uid),
                                    center_x, center_y, GRAY,
-                                   font_size=max(12, int(14 * scale)))
+                                   font_size=max(12, m.font_size))
 
             # Converge line: focused branch instance -> other branch ghost
             focused_instances = [
@@ -1269,25 +1586,21 @@ class ArcadeRenderer:
                 if e.uid == uid and (Physics.grounded(e) or e.z == -1)
             ]
             if focused_instances:
-                ghost_cx, ghost_cy = self._grid_to_screen(start_x, start_y, gx, gy, cell_size)
+                # All converge lines for this uid share one batched draw
+                converge_points = []
                 for inst in focused_instances:
                     fx, fy = inst.pos
                     focused_cx, focused_cy = self._grid_to_screen(start_x, start_y, fx, fy, cell_size)
-                    self._draw_dashed_line(focused_cx, focused_cy, ghost_cx, ghost_cy,
-                                           converge_line_color, max(1, int(2 * scale)),
-                                           int(10 * scale), slow_offset)
+                    converge_points += dashed_line_points(focused_cx, focused_cy, ghost_cx, ghost_cy,
+                                                          m.converge_dash, slow_offset)
+                if converge_points:
+                    arcade.draw_lines(converge_points, converge_line_color, m.border)
 
             # Pulsing lock corners
-            pulse = math.sin(animation_frame / 20) * 0.3 + 0.7
-            lock_color = (
-                int(fetch_line_color[0] * pulse),
-                int(fetch_line_color[1] * pulse),
-                int(fetch_line_color[2] * pulse)
-            )
             self._draw_lock_corners(start_x, start_y, (other_px, other_py), lock_color,
-                                   cell_size, size=int(24 * scale),
-                                   thickness=max(1, int(8 * scale)),
-                                   margin=-int(3 * scale))  # Inset within grid
+                                   cell_size, size=m.fetch_lock_size,
+                                   thickness=m.fetch_lock_thickness,
+                                   margin=m.lock_margin)  # Inset within grid
 
     def _draw_lock_corners(self, start_x: int, start_y: int, pos: Tuple[int, int],
                            color: Tuple, cell_size: int,
@@ -1299,24 +1612,11 @@ class ArcadeRenderer:
         cell_w = cell_size + margin * 2
         cell_h = cell_size + margin * 2
 
-        # Convert to screen coordinates
-        top = self._flip_y(rect_y)
-        bottom = self._flip_y(rect_y + cell_h)
+        # Convert to screen coordinates; corner template is relative to top-left
         left = rect_x
-        right = rect_x + cell_w
-
-        # Top-left
-        arcade.draw_line(left, top - size, left, top, color, thickness)
-        arcade.draw_line(left, top, left + size, top, color, thickness)
-        # Top-right
-        arcade.draw_line(right - size, top, right, top, color, thickness)
-        arcade.draw_line(right, top, right, top - size, color, thickness)
-        # Bottom-left
-        arcade.draw_line(left, bottom + size, left, bottom, color, thickness)
-        arcade.draw_line(left, bottom, left + size, bottom, color, thickness)
-        # Bottom-right
-        arcade.draw_line(right - size, bottom, right, bottom, color, thickness)
-        arcade.draw_line(right, bottom, right, bottom + size, color, thickness)
+        top = WINDOW_HEIGHT - rect_y
+        points = [(left + px, top + py) for px, py in lock_corner_points(cell_w, cell_h, size)]
+        arcade.draw_lines(points, color, thickness)
 
     def _draw_cell_hint(self, start_x: int, start_y: int,
                         hint: 'InteractionHint', cell_size: int, alpha: float = 1.0):
@@ -1346,34 +1646,59 @@ class ArcadeRenderer:
     def _draw_text_with_outline(self, text: str, x: int, y: int,
                                  text_color: Tuple, outline_color: Tuple,
                                  font_size: int, outline_width: int = 2):
-        """Draw text with outline for readability using cached Text objects."""
-        # Outline (8 directions) - use cached text objects
-        outline_positions = []
-        for dx in [-outline_width, 0, outline_width]:
-            for dy in [-outline_width, 0, outline_width]:
-                if dx == 0 and dy == 0:
-                    continue
-                outline_positions.append((dx, dy))
-
-        # Draw outline
-        for i, (dx, dy) in enumerate(outline_positions):
-            cache_key = f'outline_{text}_{font_size}_{i}'
-            self._draw_cached_text(cache_key, text, x + dx, y + dy, outline_color,
-                                  font_size=font_size, anchor_x="center", anchor_y="center")
-
-        # Main text
-        cache_key = f'main_{text}_{font_size}'
-        self._draw_cached_text(cache_key, text, x, y, text_color,
-                              font_size=font_size, anchor_x="center", anchor_y="center")
+        """Draw text with outline for readability using a cached label batch.
+
+        Colors are not part of the key (as in _get_text): fading hints recolor
+        the cached labels instead of building a new batch.
+        """
+        key = (text, font_size, outline_width)
+        entry = self._outline_text_cache.get(key)
+        if entry is None:
+            entry = self._create_outlined_text(text, text_color, outline_color,
+                                               font_size, outline_width)
+            self._outline_text_cache[key] = entry
+            if len(self._outline_text_cache) > OUTLINE_TEXT_CACHE_SIZE:
+                self._outline_text_cache.popitem(last=False)
+        else:
+            self._outline_text_cache.move_to_end(key)
+
+        batch, layers, last_pos, last_colors = entry
+        if last_colors != [text_color, outline_color]:
+            for _, _, text_obj in layers[:-1]:
+                text_obj.color = outline_color
+            layers[-1][2].color = text_color
+            last_colors[:] = (text_color, outline_color)
+        if last_pos != [x, y]:
+            for dx, dy, text_obj in layers:
+                text_obj.position = (x + dx, y + dy)
+            last_pos[:] = (x, y)
+
+        # All 9 copies render in one batch draw (as arcade.Text.draw does);
+        # groups keep the main text on top
+        batch.draw()
+
+    def _create_outlined_text(self, text: str, text_color: Tuple, outline_color: Tuple,
+                              font_size: int, outline_width: int) -> tuple:
+        """Build (batch, layers, last_pos, last_colors): 8 outline copies then the main text."""
+        batch = pyglet.graphics.Batch()
+        outline_group = pyglet.graphics.Group(order=0)
+        main_group = pyglet.graphics.Group(order=1)
+        layers = []
+        for dx, dy in outline_offsets(outline_width):
+            layers.append((dx, dy, arcade.Text(
+                text, 0, 0, outline_color, font_size=font_size,
+                anchor_x="center", anchor_y="center",
+                batch=batch, group=outline_group
+            )))
+        layers.append((0, 0, arcade.Text(
+            text, 0, 0, text_color, font_size=font_size,
+            anchor_x="center", anchor_y="center",
+            batch=batch, group=main_group
+        )))
+        return batch, tuple(layers), [0, 0], [text_color, outline_color]
 
     def _draw_tutorial(self, tutorial, close_hint='按 H 或 ESC 關閉'):
         """Draw overlay box (covers entire screen with semi-transparent background)."""
-        # Full-screen semi-transparent dark background
-        arcade.draw_lrbt_rectangle_filled(
-            0, WINDOW_WIDTH, 0, WINDOW_HEIGHT,
-            (0, 0, 0, 180)  # Dark overlay
-        )
-
         # Tutorial box (centered)
         box_width = 700
         padding_inner = 20
@@ -1386,11 +1711,14 @@ class ArcadeRenderer:
         x = (WINDOW_WIDTH - box_width) // 2
         y = (WINDOW_HEIGHT - box_height) // 2
 
-        # Box background (solid)
-        self._draw_rect_filled(x, y, box_width, box_height, (40, 40, 45, 255))
-
-        # Box border
-        self._draw_rect_outline(x, y, box_width, box_height, (96, 165, 250), 3)
+        # Dark overlay, box background, border and separator: one cached batch
+        sep_y = y + title_height + padding_inner
+        key = (box_height, WINDOW_WIDTH, WINDOW_HEIGHT)
+        panel = self._tutorial_panel_cache.get(key)
+        if panel is None:
+            panel = self._create_tutorial_panel(x, y, box_width, box_height, sep_y)
+            self._tutorial_panel_cache = {key: panel}
+        panel.draw()
 
         # Title
         title_y = self._flip_y(y + padding_inner + 15)
@@ -1399,26 +1727,19 @@ class ArcadeRenderer:
                                x + box_width // 2, title_y,
                                (96, 165, 250), font_size=20, anchor_x="center", anchor_y="center")
 
-        # Separator line
-        sep_y = y + title_height + padding_inner
-        arcade.draw_line(x + 20, self._flip_y(sep_y),
-                        x + box_width - 20, self._flip_y(sep_y),
-                        (96, 165, 250), 2)
-
-        # Items
-        item_y = sep_y + padding_inner
-        for i, item in enumerate(items[:max_items]):
-            screen_y = self._flip_y(item_y + 12)
+        # Items (flip once, then step down in arcade space)
+        screen_y = self._flip_y(sep_y + padding_inner + 12)
+        for item in items[:max_items]:
             # Bullet point (skip for empty items)
             if item.strip():
-                self._draw_cached_text(f'tutorial_bullet_{i}', "•",
+                self._draw_cached_text('tutorial_bullet', "•",
                                        x + padding_inner + 10, screen_y,
                                        (96, 165, 250), font_size=20, anchor_x="left", anchor_y="center")
                 # Item text
-                self._draw_cached_text(f'tutorial_item_{i}', item,
+                self._draw_cached_text('tutorial_item', item,
                                        x + padding_inner + 35, screen_y,
                                        (220, 220, 220), font_size=14, anchor_x="left", anchor_y="center")
-            item_y += line_height
+            screen_y -= line_height
 
         # Bottom hint
         hint_y = self._flip_y(y + box_height - 25)
@@ -1426,6 +1747,23 @@ class ArcadeRenderer:
                                x + box_width // 2, hint_y,
                                (150, 150, 150), font_size=12, anchor_x="center", anchor_y="center")
 
+    def _create_tutorial_panel(self, x: int, y: int, w: int, h: int,
+                               sep_y: int) -> ShapeElementList:
+        """Build the tutorial's static backdrop in absolute arcade coordinates."""
+        top = WINDOW_HEIGHT - y
+        center_x = x + w / 2
+        center_y = top - h / 2
+        sep = WINDOW_HEIGHT - sep_y
+        shapes = ShapeElementList()
+        shapes.append(create_rectangle_filled(
+            WINDOW_WIDTH / 2, WINDOW_HEIGHT / 2, WINDOW_WIDTH, WINDOW_HEIGHT,
+            (0, 0, 0, 180)  # Dark overlay
+        ))
+        shapes.append(create_rectangle_filled(center_x, center_y, w, h, (40, 40, 45, 255)))
+        shapes.append(create_rectangle_outline(center_x, center_y, w, h, (96, 165, 250), 3))
+        shapes.append(create_line(x + 20, sep, x + w - 20, sep, (96, 165, 250), 2))
+        return shapes
+
     def _draw_timeline_hint_box(self, is_active: bool):
         """Draw timeline hint box at bottom center.
 
@@ -1459,8 +1797,7 @@ class ArcadeRenderer:
         # Text
         text_x = x + box_width // 2
         text_y = self._flip_y(y + box_height // 2)
-        cache_key = f'timeline_hint_{"active" if is_active else "inactive"}'
-        self._draw_cached_text(cache_key, 'V 分裂', text_x, text_y, text_color,
+        self._draw_cached_text('timeline_hint', 'V 分裂', text_x, text_y, text_color,
                               font_size=16, anchor_x="center", anchor_y="center")
 
     def _draw_tab_switch_hint(self, branch_spec: 'BranchViewSpec', current_focus: int):
@@ -1520,9 +1857,7 @@ class ArcadeRenderer:
 
         # Text "Tab"
         text_x = x_left + 25
-        text_y = self._flip_y(y_left + box_height // 2)
-        cache_key = 'tab_hint_left_active' if left_active else 'tab_hint_left_inactive'
-        self._draw_cached_text(cache_key, 'Tab', text_x, text_y, text_color,
+        self._draw_cached_text('tab_hint_left', 'Tab', text_x, arrow_y, text_color,
                               font_size=18, anchor_x="left", anchor_y="center")
 
         # Right Tab hint: "Tab →" (active if current_focus == 0, switch to DIV 1)
@@ -1541,13 +1876,12 @@ class ArcadeRenderer:
         # Text "Tab"
         text_x = x_right + 15
         text_y = self._flip_y(y_right + box_height // 2)
-        cache_key = 'tab_hint_right_active' if right_active else 'tab_hint_right_inactive'
-        self._draw_cached_text(cache_key, 'Tab', text_x, text_y, text_color,
+        self._draw_cached_text('tab_hint_right', 'Tab', text_x, text_y, text_color,
                               font_size=18, anchor_x="left", anchor_y="center")
 
         # Right arrow
         arrow_x = x_right + box_width - 20
-        arrow_y = self._flip_y(y_right + box_height // 2)
+        arrow_y = text_y
         points_right = [
             (arrow_x + arrow_size, arrow_y),  # Right point
             (arrow_x, arrow_y - arrow_size // 2),  # Top left
@@ -1602,52 +1936,6 @@ class ArcadeRenderer:
         self._draw_cached_text('merge_hint', 'V 合併', text_x, text_y, (255, 255, 255),
                               font_size=16, anchor_x="center", anchor_y="center")
 
-    def _draw_merge_progress(self, progress: float):
-        """Draw V-key hold progress bar (top-left corner)."""
-        bar_width = 120
-        bar_height = 8
-        x = PADDING
-        y = self._flip_y(50)  # Near top
-
-        # Background
-        arcade.draw_lrbt_rectangle_filled(
-            x, x + bar_width, y - bar_height // 2, y + bar_height // 2,
-            (80, 80, 80)
-        )
-
-        # Fill
-        fill_w = int(bar_width * progress)
-        if fill_w > 0:
-            color = (150, 50, 150) if progress < 1.0 else (200, 80, 200)
-            arcade.draw_lrbt_rectangle_filled(
-                x, x + fill_w, y - bar_height // 2, y + bar_height // 2,
-                color
-            )
-
-        # Label (cached)
-        label_obj = self._merge_labels['ready'] if progress >= 1.0 else self._merge_labels['merging']
-        label_obj.x = x + bar_width + 8
-        label_obj.y = y
-        label_obj.draw()
-
-    def _draw_merge_overlay(self, spec: 'FrameViewSpec', focused: 'BranchViewSpec'):
-        """Draw merge preview overlay on focused branch."""
-        cell_size = self._scaled_cell_size(focused.scale)
-        grid_px = cell_size * self.grid_size
-        margin = int(12 * focused.scale)
-
-        # We'll draw the preview state at the focused panel's position
-        # with alpha blending based on v_hold_progress
-        alpha = int(255 * spec.v_hold_progress)
-
-        # For now, just draw a semi-transparent overlay
-        # Full implementation would render preview to texture
-        self._draw_rect_filled(
-            focused.pos_x - margin, focused.pos_y - margin,
-            grid_px + margin * 2, grid_px + margin * 2,
-            (150, 50, 150, int(50 * spec.v_hold_progress))
-        )
-
     def _draw_overlay(self, text: str, color: Tuple):
         """Draw full-screen overlay (collapse/victory)."""
         # Semi-transparent background
@@ -1703,7 +1991,7 @@ class ArcadeRenderer:
         text_y = self._flip_y(y + indicator_height // 2)
 
         self._draw_cached_text(
-            f'fetch_indicator_{enabled}',
+            'fetch_indicator',
             text,
             text_x, text_y,
             text_color,
@@ -0,0 +1,340 @@
+"""
+Unit tests for renderer geometry helpers and a headless draw smoke test
+
+The cached geometry helpers in render_arc replaced inline per-frame loops;
+each test compares a helper against the loop it replaced (kept here as a
+reference implementation). The smoke test draws real frames through a
+headless arcade window, so arcade API misuse shows up without a display.
+"""
+
+import math
+import os
+import random
+import sys
+
+# Must be set before arcade is first imported
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+from render_arc import (
+    BOX_COLORS, CELL_SIZE, GHOST_BOX_COLORS, GRAY, PREVIEW_BOX_COLORS,
+    SHADOW_BOX_COLORS, SWITCH_INNER, SWITCH_ON_BORDER, WINDOW_HEIGHT, arrow_offsets,
+    dashed_line_points, dashed_rect_points, desaturate_color, lock_corner_points,
+    ring_strip_points
+)
+
+
+def _segments(points):
+    """Pair a flat endpoint list into a sorted list of segments."""
+    return sorted(zip(points[0::2], points[1::2]))
+
+
+def reference_dashed_line(x1, y1, x2, y2, dash_length=9, offset=0):
+    """Original per-dash loop from _draw_dashed_line."""
+    dist = math.sqrt((x2 - x1)**2 + (y2 - y1)**2)
+    if dist == 0:
+        return []
+
+    dx = (x2 - x1) / dist
+    dy = (y2 - y1) / dist
+
+    period = dash_length * 2
+    pos = offset % period
+    points = []
+    while pos < dist:
+        seg_start = max(0.0, pos)
+        seg_end = min(dist, pos + dash_length)
+        if seg_end > seg_start:
+            points.append((int(x1 + dx * seg_start), int(y1 + dy * seg_start)))
+            points.append((int(x1 + dx * seg_end), int(y1 + dy * seg_end)))
+        pos += period
+    return points
+
+
+def reference_dashed_rect(x, y, w, h, dash_len=5, gap_len=5):
+    """Original four edge loops from _draw_dashed_rect (arcade coordinates)."""
+    flip = lambda v: WINDOW_HEIGHT - v
+    points = []
+    for i in range(0, w, dash_len + gap_len):
+        end_i = min(i + dash_len, w)
+        points += [(x + i, flip(y)), (x + end_i, flip(y))]
+        points += [(x + i, flip(y + h)), (x + end_i, flip(y + h))]
+    for i in range(0, h, dash_len + gap_len):
+        end_i = min(i + dash_len, h)
+        points += [(x, flip(y + i)), (x, flip(y + end_i))]
+        points += [(x + w, flip(y + i)), (x + w, flip(y + end_i))]
+    return points
+
+
+def reference_lock_corners(left, top, right, bottom, size):
+    """Original eight draw_line calls from _draw_lock_corners."""
+    return [
+        (left, top - size), (left, top), (left, top), (left + size, top),
+        (right - size, top), (right, top), (right, top), (right, top - size),
+        (left, bottom + size), (left, bottom), (left, bottom), (left + size, bottom),
+        (right - size, bottom), (right, bottom), (right, bottom), (right, bottom + size),
+    ]
+
+
+def reference_arrow(cx, cy, dx, dy, size):
+    """Original branch table from _draw_arrow."""
+    half = size // 2
+    if dy == 1:
+        return [(cx, cy + size), (cx - half, cy + half), (cx + half, cy + half)]
+    elif dy == -1:
+        return [(cx, cy - size), (cx - half, cy - half), (cx + half, cy - half)]
+    elif dx == -1:
+        return [(cx - size, cy), (cx - half, cy - half), (cx - half, cy + half)]
+    return [(cx + size, cy), (cx + half, cy - half), (cx + half, cy + half)]
+
+
+def test_dashed_line_matches_loop():
+    """Test: cached dash offsets reproduce the per-dash loop exactly"""
+    print("\n[Test 1] dashed_line_points vs per-dash loop")
+
+    rng = random.Random(1)
+    for _ in range(5000):
+        # Include off-screen (negative) endpoints: truncation must still match
+        x1, y1, x2, y2 = (rng.randint(-200, 1200) for _ in range(4))
+        dash_length = rng.choice((9, 10, 12))
+        offset = rng.randint(0, 400) * 0.25
+        expected = reference_dashed_line(x1, y1, x2, y2, dash_length, offset)
+        actual = dashed_line_points(x1, y1, x2, y2, dash_length, offset)
+        assert actual == expected, \
+            f"Mismatch for {(x1, y1, x2, y2, dash_length, offset)}: {actual} != {expected}"
+
+    assert dashed_line_points(5, 5, 5, 5) == [], "Zero-length line should have no dashes"
+    print("[OK] PASS: Dash endpoints identical to the loop")
+
+
+def test_dashed_rect_matches_loop():
+    """Test: dashed rect template translates to the original edge dashes"""
+    print("\n[Test 2] dashed_rect_points vs edge loops")
+
+    for x, y, w, h in [(10, 20, 40, 40), (0, 0, 7, 13), (300, 150, 96, 60), (5, 5, 1, 1)]:
+        top = WINDOW_HEIGHT - y
+        actual = [(x + px, top + py) for px, py in dashed_rect_points(w, h)]
+        expected = reference_dashed_rect(x, y, w, h)
+        assert _segments(actual) == _segments(expected), f"Mismatch for rect {(x, y, w, h)}"
+
+    print("[OK] PASS: Same dash segments as the edge loops")
+
+
+def test_lock_corners_match_lines():
+    """Test: lock corner template translates to the original 8 brackets"""
+    print("\n[Test 3] lock_corner_points vs draw_line calls")
+
+    for left, top, w, h, size in [(100, 500, 96, 96, 24), (0, 300, 60, 60, 15), (42, 42, 10, 20, 4)]:
+        actual = [(left + px, top + py) for px, py in lock_corner_points(w, h, size)]
+        expected = reference_lock_corners(left, top, left + w, top - h, size)
+        assert _segments(actual) == _segments(expected), f"Mismatch for {(left, top, w, h, size)}"
+
+    print("[OK] PASS: Same bracket segments")
+
+
+def test_arrow_offsets_match_branches():
+    """Test: arrow offsets translate to the original triangle for every direction"""
+    print("\n[Test 4] arrow_offsets vs direction branches")
+
+    for dx, dy in [(0, 1), (0, -1), (-1, 0), (1, 0)]:
+        for size in (21, 14, 5):
+            cx, cy = 250, 300
+            actual = [(cx + ox, cy + oy) for ox, oy in arrow_offsets(dx, dy, size)]
+            assert actual == reference_arrow(cx, cy, dx, dy, size), \
+                f"Mismatch for direction {(dx, dy)} size {size}"
+
+    print("[OK] PASS: Same triangles")
+
+
+def test_ring_strip_band():
+    """Test: ring strip alternates outer/inner points on the expected radii"""
+    print("\n[Test 5] ring_strip_points band")
+
+    for radius, width in [(16, 3), (40, 2), (5, 1)]:
+        points = ring_strip_points(radius, width)
+        assert len(points) % 2 == 0 and len(points) >= 8, "Strip needs closed outer/inner pairs"
+        for i, (px, py) in enumerate(points):
+            expected = radius if i % 2 == 0 else radius - width
+            assert abs(math.hypot(px, py) - expected) < 1e-9, f"Point {i} off the band"
+        for first, last in zip(points[:2], points[-2:]):
+            assert math.dist(first, last) < 1e-9, "Strip must close on its first pair"
+
+    print("[OK] PASS: Ring band spans radius - width to radius")
+
+
+def reference_grid_rects(state, start_x, start_y, cell_size, grid_size):
+    """Original _draw_grid_lines loop, as (left, right, bottom, top, rgb, thickness)."""
+    from timeline_system import TerrainType
+    scale = cell_size / CELL_SIZE
+    rects = []
+    for gx in range(grid_size):
+        for gy in range(grid_size):
+            pos = (gx, gy)
+            cell_x = start_x + gx * cell_size
+            cell_y = start_y + gy * cell_size
+            terrain = state.terrain.get(pos)
+            if terrain == TerrainType.SWITCH:
+                rgb = SWITCH_ON_BORDER if state.switch_activated(pos) else SWITCH_INNER
+                inset = max(1, int(3 * scale))
+                x, y = cell_x + inset, cell_y + inset
+                size, thickness = cell_size - inset * 2, max(1, int(3 * scale))
+            elif terrain == TerrainType.WALL:
+                continue
+            else:
+                rgb = GRAY
+                x, y, size, thickness = cell_x, cell_y, cell_size, 1
+            top = WINDOW_HEIGHT - y
+            rects.append((x, x + size, top - size, top, rgb, thickness))
+    return sorted(rects)
+
+
+def test_grid_rects_match_rect_outlines():
+    """Test: cached grid and switch rects keep the original edges, odd cell sizes included"""
+    print("\n[Test 6] Grid outline rects vs _draw_rect_outline loop")
+
+    from game_controller import GameController
+    from map_parser import parse_dual_layer
+    from render_arc import ArcadeRenderer
+
+    floor = "\n".join([".....", ".#...", ".....", ".S.S.", "....G"])
+    objects = "\n".join([".....", ".....", ".P...", "...B.", "....."])
+    source = parse_dual_layer(floor, objects)
+    state = GameController(source).get_active_branch()
+    renderer = ArcadeRenderer()
+    renderer.set_grid_size(source.grid_size)
+
+    start_x, start_y = 123, 77
+    top = WINDOW_HEIGHT - start_y
+    # 67 is the 5x5 side panel (int(96 * 0.7)); the others are merge-preview steps
+    for cell_size in (96, 67, 45, 33, 9):
+        actual = []
+        for rects in (renderer._grid_outline_rects(state, cell_size),
+                      renderer._switch_border_rects(state, cell_size)):
+            for cx, cy, size, rgb, thickness in rects:
+                half = size / 2
+                actual.append((start_x + cx - half, start_x + cx + half,
+                               top + cy - half, top + cy + half, rgb, thickness))
+        expected = reference_grid_rects(state, start_x, start_y, cell_size, source.grid_size)
+        assert sorted(actual) == expected, f"Grid rect edges moved for cell size {cell_size}"
+
+    print("[OK] PASS: Same rect edges for even and odd cell sizes")
+
+
+def test_desaturated_palettes():
+    """Test: precomputed palettes equal desaturate_color per entry"""
+    print("\n[Test 7] Desaturated box palettes")
+
+    for palette, amount in [(PREVIEW_BOX_COLORS, 0.3), (SHADOW_BOX_COLORS, 0.5),
+                            (GHOST_BOX_COLORS, 0.7)]:
+        assert palette == [desaturate_color(c, amount) for c in BOX_COLORS], \
+            f"Palette for amount {amount} out of sync with BOX_COLORS"
+
+    print("[OK] PASS: Palettes in sync")
+
+
+def test_headless_draw_frame_smoke():
+    """Test: full frames draw headlessly with a shadow box, a hint and a merge fade"""
+    print("\n[Test 8] Headless draw_frame smoke test")
+
+    import arcade
+    from game_controller import GameController
+    from map_parser import parse_dual_layer
+    from presentation_model import ViewModelBuilder
+    from render_arc import ArcadeRenderer, WINDOW_WIDTH
+    from timeline_system import Entity, EntityType, TerrainType
+
+    floor = "\n".join([".....", ".v...", ".....", ".S...", "....G"])
+    objects = "\n".join([".....", ".P...", ".B...", ".....", "....."])
+    source = parse_dual_layer(floor, objects)
+
+    window = arcade.Window(WINDOW_WIDTH, WINDOW_HEIGHT, "render smoke test", visible=False)
+    try:
+        controller = GameController(source)
+        renderer = ArcadeRenderer()
+        renderer.set_grid_size(source.grid_size)
+
+        assert controller.try_branch(), "Expected to branch from the start tile"
+        state = controller.get_active_branch()
+        state.player.direction = (0, 1)  # Face the box: pickup hint
+
+        # Second instance of box 1 on plain floor makes it a shadow
+        state.entities.append(Entity(uid=1, type=EntityType.BOX, pos=(3, 1)))
+        assert state.is_shadow(1), "Expected box 1 to be a shadow"
+
+        def draw(frame, **kwargs):
+            spec = ViewModelBuilder.build(controller, frame, **kwargs)
+            renderer.draw_frame(spec)
+            return spec
+
+        spec = draw(1)
+        focused = spec.sub_branch if controller.current_focus == 1 else spec.main_branch
+        assert focused.interaction_hint is not None, "Expected an interaction hint"
+        draw(2)
+
+        # Boxes on plain floor do not change the terrain signature
+        signature = renderer._terrain_signature(state)
+        state.entities[-1].pos = (3, 2)
+        renderer._signature_memo.clear()
+        assert renderer._terrain_signature(state) == signature, \
+            "Box moved on floor should not invalidate terrain caches"
+        assert state.terrain.get((1, 3)) == TerrainType.SWITCH
+
+        # Merge preview fade: alpha changes every frame but must not grow the shape caches
+        draw(3, merge_preview_active=True, merge_preview_progress=1.0)
+        cached = (len(renderer._box_shape_cache), len(renderer._grid_cache),
+                  len(renderer._marker_cache))
+        for i, progress in enumerate((0.1, 0.3, 0.5, 0.7, 0.9)):
+            draw(4 + i, merge_preview_active=True, merge_preview_progress=progress)
+        assert (len(renderer._box_shape_cache), len(renderer._grid_cache),
+                len(renderer._marker_cache)) == cached, "Fading frames churned the shape caches"
+
+        # Fading an outlined label recolors its cached batch
+        labels = len(renderer._outline_text_cache)
+        for a in (255, 128, 40):
+            renderer._draw_text_with_outline('[SPACE]', 200, 200, (255, 255, 255, a),
+                                             (0, 0, 0, a), 12)
+        assert len(renderer._outline_text_cache) == labels, "Label fade churned the text cache"
+        _, layers, _, _ = renderer._outline_text_cache[('[SPACE]', 12, 2)]
+        assert tuple(layers[-1][2].color) == (255, 255, 255, 40), "Main label not recolored"
+        assert tuple(layers[0][2].color) == (0, 0, 0, 40), "Outline labels not recolored"
+    finally:
+        window.close()
+
+    print("[OK] PASS: Frames drawn without errors")
+
+
+def run_all_tests():
+    """Run all renderer geometry tests"""
+    print("=" * 60)
+    print("RENDER GEOMETRY UNIT TESTS")
+    print("=" * 60)
+
+    try:
+        test_dashed_line_matches_loop()
+        test_dashed_rect_matches_loop()
+        test_lock_corners_match_lines()
+        test_arrow_offsets_match_branches()
+        test_ring_strip_band()
+        test_grid_rects_match_rect_outlines()
+        test_desaturated_palettes()
+        test_headless_draw_frame_smoke()
+
+        print("\n" + "=" * 60)
+        print("ALL TESTS PASSED [OK]")
+        print("=" * 60)
+        return True
+
+    except AssertionError as e:
+        print(f"\nX TEST FAILED: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+    except Exception as e:
+        print(f"\nX ERROR: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+
+if __name__ == "__main__":
+    success = run_all_tests()
+    sys.exit(0 if success else 1)